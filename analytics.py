@@ -0,0 +1,114 @@
+"""
+analytics.py  —  Incremental cohort aggregates for the Placement Cell dashboard
+-------------------------------------------------------------------------------
+Every dashboard number is kept up to date as rows enter or leave the cohort,
+so reading a metric never scans the student list:
+
+    stats = CohortStats()
+    stats.add(row)                        # on upload
+    stats.remove(old); stats.add(new)     # on an edited row / status change
+    stats.total, stats.avg_cgpa, stats.placement_rate
+    stats.by_status["Shortlisted"], stats.breakdown("Branch")["CSE"]["Offer Received"]
+
+Aggregates kept
+---------------
+* counts per (Status, Branch, Company) cell, plus the per-field marginals and
+  the Status × Branch / Status × Company planes, so each view is a lookup
+* CGPA sum (→ mean) and a fixed-width CGPA histogram
+"""
+
+from collections import Counter
+
+PLACED_STATUS   = "Offer Received"
+CGPA_BIN_WIDTH  = 0.5
+CGPA_BINS       = int(10 / CGPA_BIN_WIDTH)
+
+
+def _key(row: dict) -> tuple[str, str, str]:
+    return (str(row.get("Status", "")).strip(),
+            str(row.get("Branch", "")).strip().upper(),
+            str(row.get("Company", "")).strip() or "-")
+
+
+def cgpa_bin(cgpa: float) -> int:
+    """Histogram bin of a CGPA on the 0-10 scale (10.0 falls in the last bin)."""
+    return min(max(int(cgpa / CGPA_BIN_WIDTH), 0), CGPA_BINS - 1)
+
+
+class CohortStats:
+    """Counts by Status × Branch × Company and CGPA aggregates, updated per row."""
+
+    def __init__(self):
+        self.cells:      Counter = Counter()     # (status, branch, company) → n
+        self.by_status:  Counter = Counter()
+        self.by_branch:  Counter = Counter()
+        self.by_company: Counter = Counter()
+        self._planes: dict[str, Counter] = {"Branch": Counter(), "Company": Counter()}
+        self.cgpa_hist  = [0] * CGPA_BINS
+        self.cgpa_sum   = 0.0
+        self.total      = 0
+
+    def _apply(self, row: dict, d: int) -> None:
+        status, branch, company = key = _key(row)
+        cgpa = float(row.get("CGPA", 0))
+        self.cells[key]              += d
+        self.by_status[status]       += d
+        self.by_branch[branch]       += d
+        self.by_company[company]     += d
+        self._planes["Branch"][(branch, status)]   += d
+        self._planes["Company"][(company, status)] += d
+        self.cgpa_hist[cgpa_bin(cgpa)] += d
+        self.cgpa_sum += d * cgpa
+        self.total    += d
+        if d < 0:
+            for counter, k in ((self.cells, key), (self.by_status, status),
+                               (self.by_branch, branch), (self.by_company, company),
+                               (self._planes["Branch"], (branch, status)),
+                               (self._planes["Company"], (company, status))):
+                if counter[k] <= 0:
+                    del counter[k]
+
+    def add(self, row: dict) -> None:
+        self._apply(row, 1)
+
+    def remove(self, row: dict) -> None:
+        self._apply(row, -1)
+
+    # ── reads (no cohort scan) ──────────────────────────────────────────────
+    @property
+    def avg_cgpa(self) -> float:
+        return self.cgpa_sum / self.total if self.total else 0.0
+
+    @property
+    def placed(self) -> int:
+        return self.by_status[PLACED_STATUS]
+
+    @property
+    def placement_rate(self) -> float:
+        """Fraction of the cohort holding an offer."""
+        return self.placed / self.total if self.total else 0.0
+
+    def breakdown(self, field: str) -> dict[str, Counter]:
+        """
+        Status counts per Branch or per Company.
+
+        Example
+        -------
+        >>> stats.breakdown("Branch")["CSE"]
+        Counter({'Offer Received': 2, 'Shortlisted': 2, 'Interview Scheduled': 1})
+        """
+        out: dict[str, Counter] = {}
+        for (group, status), n in self._planes[field].items():
+            out.setdefault(group, Counter())[status] = n
+        return out
+
+    def placement_rate_by(self, field: str) -> dict[str, float]:
+        """Offer rate per Branch or per Company."""
+        totals = self.by_branch if field == "Branch" else self.by_company
+        plane  = self._planes[field]
+        return {g: plane[(g, PLACED_STATUS)] / n for g, n in totals.items() if n}
+
+    def cgpa_histogram(self) -> list[tuple[str, int]]:
+        """(bin label, count) pairs, e.g. ("8.0-8.5", 3)."""
+        return [(f"{i * CGPA_BIN_WIDTH:.1f}-{(i + 1) * CGPA_BIN_WIDTH:.1f}", n)
+                for i, n in enumerate(self.cgpa_hist)]
@@ -0,0 +1,24 @@
+"""
+app_literals.py  —  Read top-level literals out of app.py without running it
+----------------------------------------------------------------------------
+Offline scripts (loadtest.py, rank_agreement.py) reuse demo data defined
+in app.py such as USERS and SAMPLE_STUDENTS. Importing app.py would start
+Streamlit, so the source is parsed with ast and only the requested literal
+is evaluated.
+
+    from app_literals import load_app_literal
+    students = load_app_literal("SAMPLE_STUDENTS")
+"""
+
+import ast
+
+
+def load_app_literal(name: str, path: str = "app.py"):
+    """Evaluate a top-level literal assignment (e.g. SAMPLE_STUDENTS) from app.py."""
+    with open(path, encoding="utf-8-sig") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise KeyError(f"{name} not found in {path}")
@@ -0,0 +1,153 @@
+"""
+bench_hashing.py  —  Memory and ranking cost of SmartMatchEngine(mode="hash")
+-----------------------------------------------------------------------------
+Streams a corpus of student profiles into document frequencies twice:
+
+  * exact  — a dict keyed by every distinct unigram / bigram / skill term
+  * hashed — HashedDocumentFrequencies, one array('I') of 2**bits counters
+
+and reports the memory each keeps (tracemalloc). It then ranks the cohort
+for every catalog job and reports how far rankings agree (Spearman ρ, top-k
+overlap) — the cost of hash collisions:
+
+  * fitted   — hash mode after .fit(corpus), i.e. the fixed-memory
+               HashedDocumentFrequencies IDF measured above, against exact
+               tfidf taking its IDF from the same corpus (the exact dict)
+  * per call — unfitted hash mode, whose IDF comes from each call's texts,
+               against the default tfidf engine (also per-call IDF)
+
+Synthetic profiles mix catalog skills with free-text project words drawn
+from a Zipf-like vocabulary of --vocab words, so the exact vocabulary keeps
+growing with the corpus the way real resumes do.
+
+Usage:
+    python bench_hashing.py                              # 20k profiles, 12/16/18 bits
+    python bench_hashing.py --profiles 100000 --bits 14 18 20
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+import tracemalloc
+
+from catalog import load_jobs
+from ml_model import SmartMatchEngine, HashedDocumentFrequencies, _hashed_tf, _sparse_cosine, _tf
+from rank_agreement import load_cohort, spearman, top_k_overlap
+
+
+def synthetic_profiles(n: int, jobs: list[dict], vocab: int, seed: int = 42) -> list[str]:
+    pool    = sorted({sk for j in jobs for sk in j["skills"]})
+    rng     = random.Random(seed)
+    words   = [f"w{i}" for i in range(vocab)]
+    weights = [1 / (i + 1) for i in range(vocab)]
+    out = []
+    for _ in range(n):
+        skills = rng.sample(pool, rng.randint(3, 7))
+        extra  = rng.choices(words, weights, k=rng.randint(4, 12))
+        out.append(" ".join(skills + extra))
+    return out
+
+
+def retained_bytes(build) -> tuple[int, float, object]:
+    """Bytes still allocated by `build()`'s result, build time, and the result."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - t
+    size = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return size, elapsed, result
+
+
+def corpus_idf_scores(profile_terms: list[str], job_terms: list[list[str]],
+                      df: dict[str, int], n_docs: int) -> list[float]:
+    """Exact tfidf scores with IDF from corpus document frequencies (as a fitted hash engine)."""
+    idf = lambda t: math.log((n_docs + 1) / (df.get(t, 0) + 1)) + 1
+    sv, *jvs = [{t: w * idf(t) for t, w in _tf(terms).items()}
+                for terms in [profile_terms] + job_terms]
+    return [round(_sparse_cosine(sv, jv) * 100, 2) for jv in jvs]
+
+
+def agreement(a_rows: list[list[float]], b_rows: list[list[float]],
+              k: int) -> tuple[float, float, float]:
+    """Mean ρ, min ρ and mean top-k overlap over jobs; rows are per-profile job scores."""
+    rhos, overlaps = [], []
+    for j in range(len(a_rows[0])):
+        a = [row[j] for row in a_rows]
+        b = [row[j] for row in b_rows]
+        rhos.append(spearman(a, b))
+        overlaps.append(top_k_overlap(a, b, k))
+    return statistics.fmean(rhos), min(rhos), statistics.fmean(overlaps)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", type=int, default=20000)
+    parser.add_argument("--vocab", type=int, default=50000,
+                        help="size of the synthetic free-text vocabulary")
+    parser.add_argument("--bits", type=int, nargs="+", default=[12, 16, 18])
+    parser.add_argument("--rank-sample", type=int, default=2000,
+                        help="profiles ranked per job for the agreement check")
+    parser.add_argument("--k", type=int, default=10, help="top-k for overlap")
+    parser.add_argument("--catalog", default="jobs.jsonl", help="job catalog (CSV or JSONL)")
+    args = parser.parse_args()
+
+    jobs      = load_jobs(args.catalog)
+    job_texts = [" ".join(j["skills"]) for j in jobs]
+    corpus    = synthetic_profiles(args.profiles, jobs, args.vocab)
+    exact     = SmartMatchEngine()
+
+    def exact_df() -> dict[str, int]:
+        df: dict[str, int] = {}
+        for text in corpus:
+            for t in set(exact.tokenize(text)):
+                df[t] = df.get(t, 0) + 1
+        return df
+
+    def hashed_df(bits: int) -> HashedDocumentFrequencies:
+        hdf = HashedDocumentFrequencies(bits)
+        for text in corpus:
+            hdf.add(_hashed_tf(exact.tokenize(text), bits))
+        return hdf
+
+    print("─" * 72)
+    print(f"Document frequencies over {len(corpus)} profiles")
+    print("─" * 72)
+    print(f"{'':<24}{'features':>12}{'memory':>14}{'vs exact':>11}{'build':>11}")
+    print("─" * 72)
+    ex_bytes, ex_s, df = retained_bytes(exact_df)
+    print(f"{'exact vocabulary':<24}{len(df):>12,}{ex_bytes / 2**20:>11.2f} MiB{'':>11}{ex_s:>10.1f}s")
+    for bits in args.bits:
+        h_bytes, h_s, _ = retained_bytes(lambda: hashed_df(bits))
+        print(f"{f'hash, {bits} bits':<24}{1 << bits:>12,}{h_bytes / 2**20:>11.2f} MiB"
+              f"{ex_bytes / h_bytes:>10.1f}×{h_s:>10.1f}s")
+
+    profiles  = load_cohort(0, jobs) + corpus[:args.rank_sample]
+    k         = min(args.k, len(profiles))
+    job_terms = [exact.tokenize(t) for t in job_texts]
+    exact_fit = [corpus_idf_scores(exact.tokenize(p), job_terms, df, len(corpus)) for p in profiles]
+    exact_call = [exact.batch_scores(p, job_texts, job_terms) for p in profiles]
+
+    print("─" * 72)
+    print(f"Rank agreement with exact tfidf ({len(profiles)} profiles × {len(jobs)} jobs)")
+    print("─" * 72)
+    print(f"{'':<24}{'IDF from':>12}{'mean ρ':>10}{'min ρ':>10}{f'top-{k} overlap':>16}")
+    print("─" * 72)
+    for bits in args.bits:
+        fitted = SmartMatchEngine(mode="hash", hash_bits=bits).fit(corpus)
+        rows   = [fitted.batch_scores(p, job_texts, job_terms) for p in profiles]
+        mean_rho, min_rho, overlap = agreement(exact_fit, rows, k)
+        print(f"{f'hash, {bits} bits':<24}{'corpus':>12}{mean_rho:>10.4f}{min_rho:>10.4f}{overlap:>16.0%}")
+    print("─" * 72)
+    for bits in args.bits:
+        per_call = SmartMatchEngine(mode="hash", hash_bits=bits)
+        rows     = [per_call.batch_scores(p, job_texts, job_terms) for p in profiles]
+        mean_rho, min_rho, overlap = agreement(exact_call, rows, k)
+        print(f"{f'hash, {bits} bits':<24}{'per call':>12}{mean_rho:>10.4f}{min_rho:>10.4f}{overlap:>16.0%}")
+    print("─" * 72)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+bench_startup.py  —  Cold-start benchmark for app.py
+----------------------------------------------------
+Reports two things:
+
+  1. Import time of each dependency, measured in a fresh interpreter so
+     nothing is already cached in sys.modules.
+  2. Time-to-first-render of app.py for the login page and each role view,
+     measured with Streamlit's headless AppTest runner.
+
+Usage:
+    python bench_startup.py            # 5 runs per view
+    python bench_startup.py --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = ["streamlit", "ml_model", "resume_generator", "google.genai"]
+
+# Session state for a logged-in user, mirroring the sidebar login handler.
+ROLE_STATES = {
+    "student": {"role": "student", "username": "ashutosh",
+                "display": "Ashutosh Shri Mishra"},
+    "cell":    {"role": "cell", "username": "placement",
+                "display": "Placement Cell - NIT Agartala"},
+}
+
+
+def import_time_ms(module: str) -> float | None:
+    """Import `module` in a fresh interpreter; None if it is not installed."""
+    code = ("import time; t = time.perf_counter(); "
+            f"import {module}; print((time.perf_counter() - t) * 1000)")
+    proc = subprocess.run([sys.executable, "-c", code],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    return float(proc.stdout.strip())
+
+
+def render_ms(role: str | None, runs: int) -> list[float]:
+    """Time a full first script run of app.py, optionally logged in as `role`."""
+    from streamlit.testing.v1 import AppTest
+
+    timings = []
+    for _ in range(runs):
+        at = AppTest.from_file("app.py", default_timeout=60)
+        if role is not None:
+            at.session_state["logged_in"]    = True
+            at.session_state["applications"] = {}
+            for key, value in ROLE_STATES[role].items():
+                at.session_state[key] = value
+        t = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - t) * 1000)
+        if at.exception:
+            raise RuntimeError(f"app.py raised in view {role!r}: {at.exception}")
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print("─" * 60)
+    print(f"{'Import (fresh interpreter)':<40}{'ms':>10}")
+    print("─" * 60)
+    for module in MODULES:
+        ms = import_time_ms(module)
+        print(f"{module:<40}{'n/a' if ms is None else f'{ms:.1f}':>10}")
+
+    print("─" * 60)
+    print(f"{'Time-to-first-render':<28}{'min':>10}{'median':>10}{'max':>10}")
+    print("─" * 60)
+    for label, role in [("login page", None),
+                        ("student view", "student"),
+                        ("placement cell view", "cell")]:
+        t = render_ms(role, args.runs)
+        print(f"{label:<28}{min(t):>10.1f}{statistics.median(t):>10.1f}{max(t):>10.1f}")
+    print("─" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+catalog.py  —  Job catalog loaded from CSV / JSONL files
+--------------------------------------------------------
+Postings live in a file (jobs.jsonl by default) instead of a literal in
+app.py. The catalog streams the file row by row, validates each posting
+against a small schema and indexes the result by id, company and location:
+
+    catalog = JobCatalog("jobs.jsonl", engine=_engine)
+    catalog.refresh()                 # cheap no-op unless the file changed
+    snap = catalog.snapshot()         # one consistent version of everything below
+    snap.jobs, snap.get(3), snap.select(locations=["Remote"])
+    snap.skill_texts, snap.terms      # match text + pre-tokenized skills per job
+
+Change detection
+----------------
+refresh() compares the file's (mtime, size) first and only hashes the
+content when they moved; the catalog — and everything derived from it, the
+pre-tokenized skill terms and, for an LSA engine, the fitted projection — is
+rebuilt only when the hash differs.
+
+File formats
+------------
+JSONL: one object per line with the keys of REQUIRED / OPTIONAL below;
+       "skills" is a list, "eligibility" an object (see eligibility.py).
+CSV:   the same columns, with skills as "python; sql" and the eligibility
+       rules flattened into branches ("CSE; IT"), min_cgpa, exclude_status.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Iterator
+
+REQUIRED = ("id", "title", "company", "skills")
+OPTIONAL = {"location": "", "ctc": "", "desc": "", "eligibility": None}
+
+_LIST_SPLIT = re.compile(r"\s*[;,]\s*")
+
+
+class CatalogError(ValueError):
+    """A posting or catalog file that does not match the schema."""
+
+
+def _as_list(value) -> list[str]:
+    if isinstance(value, str):
+        return [v for v in _LIST_SPLIT.split(value.strip()) if v]
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return [v.strip() for v in value if v.strip()]
+    raise CatalogError(f"expected a list of strings, got {value!r}")
+
+
+def validate_job(raw: dict) -> dict:
+    """Normalise one raw posting; raises CatalogError on schema violations."""
+    missing = [k for k in REQUIRED if raw.get(k) in (None, "", [])]
+    if missing:
+        raise CatalogError(f"missing {', '.join(missing)}")
+    try:
+        job_id = int(raw["id"])
+    except (TypeError, ValueError):
+        raise CatalogError(f"id must be an integer, got {raw['id']!r}") from None
+
+    job = {"id": job_id,
+           "title":   str(raw["title"]).strip(),
+           "company": str(raw["company"]).strip(),
+           **{k: str(raw.get(k) or d).strip() for k, d in OPTIONAL.items() if k != "eligibility"},
+           "skills":  [s.lower() for s in _as_list(raw["skills"])]}
+
+    rules = raw.get("eligibility")
+    if rules is None and any(raw.get(k) for k in ("branches", "min_cgpa", "exclude_status")):
+        rules = {k: raw.get(k) for k in ("branches", "min_cgpa", "exclude_status")}
+    if rules:
+        if not isinstance(rules, dict):
+            raise CatalogError(f"eligibility must be an object, got {rules!r}")
+        try:
+            min_cgpa = float(rules.get("min_cgpa") or 0)
+        except (TypeError, ValueError):
+            raise CatalogError(f"min_cgpa must be a number, got {rules.get('min_cgpa')!r}") from None
+        job["eligibility"] = {
+            "branches":       [b.upper() for b in _as_list(rules.get("branches") or [])],
+            "min_cgpa":       min_cgpa,
+            "exclude_status": _as_list(rules.get("exclude_status") or []),
+        }
+    return job
+
+
+def iter_jobs(path: str, errors: list[str] | None = None) -> Iterator[dict]:
+    """
+    Stream validated postings from a .csv or .jsonl file.
+
+    Invalid rows raise CatalogError, or — when an `errors` list is passed —
+    are skipped and reported there as "path:line: reason".
+    """
+    def rows() -> Iterator[tuple[int, dict]]:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            if path.lower().endswith(".csv"):
+                reader = csv.DictReader(f)
+                for row in reader:
+                    yield reader.line_num, row
+            else:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        row = CatalogError(f"invalid JSON ({e.msg})")
+                    yield line_no, row
+
+    seen: set[int] = set()
+    for line_no, raw in rows():
+        try:
+            if isinstance(raw, CatalogError):
+                raise raw
+            if not isinstance(raw, dict):
+                raise CatalogError("expected an object")
+            job = validate_job(raw)
+            if job["id"] in seen:
+                raise CatalogError(f"duplicate id {job['id']}")
+        except CatalogError as e:
+            if errors is None:
+                raise CatalogError(f"{path}:{line_no}: {e}") from None
+            errors.append(f"{path}:{line_no}: {e}")
+            continue
+        seen.add(job["id"])
+        yield job
+
+
+def load_jobs(path: str = "jobs.jsonl") -> list[dict]:
+    """All postings in `path`, strictly validated (for scripts and the CLI)."""
+    return list(iter_jobs(path))
+
+
+def _file_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class CatalogSnapshot:
+    """
+    One loaded version of the catalog: postings, their match texts and
+    pre-tokenized terms, and the indexes over them. Never mutated after it
+    is built, so positions from select() always index this snapshot's lists.
+    """
+
+    def __init__(self, jobs: list[dict], skill_texts: list[str],
+                 terms: list[list[str]], errors: list[str], version: int):
+        self.jobs        = jobs
+        self.skill_texts = skill_texts
+        self.terms       = terms
+        self.errors      = errors      # rows skipped while loading this version
+        self.version     = version
+        self._by_id:       dict[int, dict]      = {j["id"]: j for j in jobs}
+        self._by_text:     dict[str, list[str]] = dict(zip(skill_texts, terms))
+        self._by_company:  dict[str, list[int]] = {}
+        self._by_location: dict[str, list[int]] = {}
+        for i, job in enumerate(jobs):
+            self._by_company.setdefault(job["company"].lower(), []).append(i)
+            self._by_location.setdefault(job["location"].lower(), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def get(self, job_id: int) -> dict | None:
+        return self._by_id.get(job_id)
+
+    def terms_for(self, skill_text: str) -> list[str] | None:
+        """Pre-tokenized terms of a job skill text in this version, or None."""
+        return self._by_text.get(skill_text)
+
+    @property
+    def companies(self) -> list[str]:
+        return sorted({self.jobs[ix[0]]["company"] for ix in self._by_company.values()})
+
+    @property
+    def locations(self) -> list[str]:
+        return sorted({self.jobs[ix[0]]["location"] for ix in self._by_location.values()})
+
+    def select(self, companies: list[str] | None = None,
+               locations: list[str] | None = None) -> list[int]:
+        """
+        Positions (into jobs / skill_texts / terms) of postings matching any
+        of `companies` and any of `locations`; an empty filter matches all.
+
+        Example
+        -------
+        >>> snap = catalog.snapshot()
+        >>> [snap.jobs[i]["title"] for i in snap.select(locations=["Remote"])]
+        ['Data Analyst', 'Blockchain Developer']
+        """
+        picked = None
+        for index, wanted in ((self._by_company, companies), (self._by_location, locations)):
+            if wanted:
+                hits = {i for w in wanted for i in index.get(w.lower(), ())}
+                picked = hits if picked is None else picked & hits
+        return list(range(len(self.jobs))) if picked is None else sorted(picked)
+
+
+class JobCatalog:
+    """
+    Postings from one catalog file, published as a CatalogSnapshot.
+
+    Each reload builds a complete new snapshot and swaps it in with a single
+    assignment; readers call snapshot() once and index only that object, so
+    a reload in another session can never mix two versions of the job list.
+
+    With an `engine` (SmartMatchEngine), each reload also pre-tokenizes the
+    skill text of every job and, in lsa mode, refits the engine on skills +
+    descriptions, so scoring calls never re-tokenize job postings. Score
+    with that same engine — its vocabulary is the one the terms came from.
+
+    A file that fails to load is remembered by (mtime, size) and hash: the
+    previous snapshot stays published, `error` holds the reason, and refresh()
+    does not re-read the file until it changes again.
+    """
+
+    def __init__(self, path: str, engine=None):
+        self.path   = path
+        self.engine = engine
+        self.error: str | None = None          # why the current file failed to load
+        self._snap  = CatalogSnapshot([], [], [], [], version=0)
+        self._stat: tuple[int, int] | None = None
+        self._hash: str | None = None
+        self._lock  = threading.Lock()
+
+    def snapshot(self) -> CatalogSnapshot:
+        """The current version; take it once per render and index only it."""
+        return self._snap
+
+    def refresh(self) -> bool:
+        """
+        Reload if the file changed since the last call; True if it was rebuilt.
+
+        Raises OSError / CatalogError once per failing version of the file,
+        then returns False for it until it changes (see `error`).
+        """
+        with self._lock:
+            try:
+                st   = os.stat(self.path)
+                stat = (st.st_mtime_ns, st.st_size)
+                if stat == self._stat:
+                    return False
+                digest = _file_hash(self.path)
+            except OSError as e:
+                # Missing / unreadable file: keep the snapshot, report it once
+                if self._stat is None and self.error is not None:
+                    return False
+                self._stat, self.error = None, str(e)
+                raise
+            if digest == self._hash:
+                self._stat, self.error = stat, None
+                return False
+            self._stat, self._hash = stat, digest
+            try:
+                self._snap = self._load(self._snap.version + 1)
+            except (OSError, CatalogError) as e:
+                self.error = str(e)
+                raise
+            self.error = None
+            return True
+
+    def _load(self, version: int) -> CatalogSnapshot:
+        errors: list[str] = []
+        jobs = list(iter_jobs(self.path, errors))
+        if not jobs:
+            raise CatalogError(f"{self.path}: no valid job postings" +
+                               (f" ({errors[0]} …)" if errors else ""))
+
+        skill_texts = [" ".join(j["skills"]) for j in jobs]
+        terms: list[list[str]] = []
+        if self.engine is not None:
+            terms = [self.engine.tokenize(t) for t in skill_texts]
+            if self.engine.mode == "lsa":
+                self.engine.fit([f"{t} {j['desc']}" for t, j in zip(skill_texts, jobs)])
+        return CatalogSnapshot(jobs, skill_texts, terms, errors, version)
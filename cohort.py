@@ -0,0 +1,156 @@
+"""
+cohort.py  —  Student cohort with delta merges for repeated CSV uploads
+-----------------------------------------------------------------------
+The placement cell re-uploads the cohort CSV several times a day, mostly to
+change statuses. Instead of replacing everything, each upload is merged
+against the current cohort row by row:
+
+    cohort = Cohort(SAMPLE_STUDENTS)
+    diff   = cohort.merge(rows_from_csv)
+    diff.added / diff.changed / diff.unchanged / diff.removed   → lists of Names
+    diff.status_changed                                         → status-only edits
+
+Rows are keyed on Name plus a fingerprint of the fields that matter for
+matching (Skills, CGPA, Branch). Fit scores are cached per fingerprint, so
+only added or changed students are ever re-scored; a status-only edit just
+moves the aggregates in `cohort.stats` (see analytics.py). `cohort.eligibility` is a bitmap index over the
+current rows (see eligibility.py), rebuilt lazily after a merge.
+"""
+
+import hashlib
+from typing import Callable, Iterable
+
+from analytics import CohortStats
+from eligibility import EligibilityIndex
+
+
+def fingerprint(row: dict) -> str:
+    """Stable hash of the matching-relevant fields of one student row."""
+    skills = ",".join(s.strip().lower() for s in str(row.get("Skills", "")).split(","))
+    key    = f"{skills}|{float(row.get('CGPA', 0)):.2f}|{str(row.get('Branch', '')).strip().upper()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class CohortDiff:
+    """Outcome of one Cohort.merge(), as lists of student Names."""
+
+    def __init__(self):
+        self.added:          list[str] = []
+        self.changed:        list[str] = []
+        self.unchanged:      list[str] = []
+        self.removed:        list[str] = []
+        self.status_changed: list[str] = []   # unchanged fingerprint, new Status
+
+    @property
+    def rescore(self) -> list[str]:
+        """Students whose skill vectors must be (re)computed."""
+        return self.added + self.changed
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.changed)} changed, "
+                f"{len(self.unchanged)} unchanged ({len(self.status_changed)} status-only), "
+                f"{len(self.removed)} removed")
+
+
+class Cohort:
+    """Current student rows, their fingerprints, aggregates and cached fit scores."""
+
+    def __init__(self, rows: Iterable[dict] = ()):
+        self._rows: dict[str, dict] = {}
+        self._fps:  dict[str, str]  = {}
+        self._list: list[dict] | None = None
+        self._elig: EligibilityIndex | None = None
+        self._scores: dict[tuple[str, str], int] = {}    # (fingerprint, job skill text) → score
+        self.stats   = CohortStats()
+        self.version = 0
+        self.merge(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def students(self) -> list[dict]:
+        """Rows in upload order; the same list object until the next merge."""
+        if self._list is None:
+            self._list = list(self._rows.values())
+        return self._list
+
+    @property
+    def eligibility(self) -> EligibilityIndex:
+        """Bitmap index over `students`; rebuilt on first use after a merge."""
+        if self._elig is None:
+            self._elig = EligibilityIndex(self.students)
+        return self._elig
+
+    def merge(self, incoming: Iterable[dict]) -> CohortDiff:
+        """Replace the cohort with `incoming`, touching only rows that differ."""
+        diff, seen, touched = CohortDiff(), set(), False
+        for row in incoming:
+            name = row["Name"]
+            seen.add(name)
+            fp  = fingerprint(row)
+            old = self._rows.get(name)
+            if old is None:
+                diff.added.append(name)
+            elif self._fps[name] != fp:
+                diff.changed.append(name)
+            else:
+                diff.unchanged.append(name)
+                if old == row:
+                    continue
+                if old.get("Status") != row.get("Status"):
+                    diff.status_changed.append(name)
+            touched = True
+            if old is not None:
+                self.stats.remove(old)
+            self.stats.add(row)
+            self._rows[name], self._fps[name] = row, fp
+
+        for name in [n for n in self._rows if n not in seen]:
+            touched = True
+            diff.removed.append(name)
+            self.stats.remove(self._rows.pop(name))
+            del self._fps[name]
+
+        if diff.rescore or diff.removed:
+            live = set(self._fps.values())
+            self._scores = {k: v for k, v in self._scores.items() if k[0] in live}
+        if touched:
+            self.version += 1
+            self._list = None
+            self._elig = None
+        return diff
+
+    def _score(self, fp: str, row: dict, job_text: str,
+               scorer: Callable[[str, list[str]], list[int]]) -> int:
+        key = (fp, job_text)                        # text, not id: catalog edits invalidate
+        score = self._scores.get(key)
+        if score is None:
+            sc = scorer(row["Skills"].replace(",", " ").lower(), [job_text])
+            score = self._scores[key] = sc[0] if sc else 0
+        return score
+
+    def scores(self, job: dict, scorer: Callable[[str, list[str]], list[int]],
+               rows: Iterable[dict] | None = None) -> list[tuple[dict, int]]:
+        """
+        (row, fit score) for every student against `job`, or only for `rows`
+        (e.g. the eligible subset from cohort.eligibility).
+
+        Only students whose fingerprint has no cached score for this job are
+        passed to `scorer` (ml_fit_score-compatible).
+        """
+        job_text = " ".join(job["skills"])
+        return [(row, self._score(self._fps[row["Name"]], row, job_text, scorer))
+                for row in (self._rows.values() if rows is None else rows)]
+
+    def row_scores(self, row: dict, jobs: list[dict],
+                   scorer: Callable[[str, list[str]], list[int]]) -> list[int]:
+        """
+        Fit scores of one row against each of `jobs`, through the same cache.
+
+        Safe to call from a background task while merges happen: a row that
+        is no longer current is fingerprinted afresh.
+        """
+        name = row["Name"]
+        fp   = self._fps[name] if self._rows.get(name) is row else fingerprint(row)
+        return [self._score(fp, row, " ".join(job["skills"]), scorer) for job in jobs]
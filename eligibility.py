@@ -0,0 +1,116 @@
+"""
+eligibility.py  —  Bitmap index for drive eligibility pre-filtering
+-------------------------------------------------------------------
+Drives come with rules like "CSE/IT/ECE only, CGPA ≥ 8.0, no existing
+offer". Instead of scanning the cohort per rule, the index keeps one bitset
+per branch and per status (Python ints, bit i = student i) plus "CGPA ≥ x"
+bitsets cut from the cohort sorted by CGPA. A job's eligible set is then a
+handful of bitwise ORs/ANDs, and only those students are handed to the
+matching engine.
+
+    index = EligibilityIndex(students)
+    bits  = index.eligible(job["eligibility"])   # {"branches": [...], "min_cgpa": 8.0,
+                                                 #  "exclude_status": ["Offer Received"]}
+    index.count(bits), index.select(bits)
+"""
+
+from bisect import bisect_left
+
+# _BYTE_BITS[b] = positions of the set bits in byte value b, for decoding
+_BYTE_BITS = [tuple(i for i in range(8) if b >> i & 1) for b in range(256)]
+
+
+def _pack(indices, n: int) -> int:
+    """Bitset (int) with the given positions set, built in one pass over a bytearray."""
+    buf = bytearray((n + 7) >> 3)
+    for i in indices:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+class EligibilityIndex:
+    """Per-branch / per-status bitsets and CGPA threshold bitsets over a cohort."""
+
+    def __init__(self, students: list[dict]):
+        self.students = students
+        n = len(students)
+        self.all_bits = (1 << n) - 1
+        branch: dict[str, list[int]] = {}
+        status: dict[str, list[int]] = {}
+        for i, s in enumerate(students):
+            branch.setdefault(str(s.get("Branch", "")).strip().upper(), []).append(i)
+            status.setdefault(str(s.get("Status", "")).strip(), []).append(i)
+        # Each bitset is packed once; OR-ing one bit at a time would copy the int n times
+        self._branch = {k: _pack(ix, n) for k, ix in branch.items()}
+        self._status = {k: _pack(ix, n) for k, ix in status.items()}
+
+        # Students sorted by CGPA; "CGPA ≥ x" is a suffix of this order, packed
+        # on first use and cached per threshold (jobs share a handful of cut-offs)
+        cgpa = [float(s.get("CGPA", 0)) for s in students]
+        self._by_cgpa = sorted(range(n), key=cgpa.__getitem__)
+        self._cgpas   = [cgpa[i] for i in self._by_cgpa]
+        self._cgpa_cache: dict[float, int] = {}
+
+    def branch_bits(self, branches) -> int:
+        bits = 0
+        for b in branches:
+            bits |= self._branch.get(b.strip().upper(), 0)
+        return bits
+
+    def status_bits(self, statuses) -> int:
+        bits = 0
+        for st in statuses:
+            bits |= self._status.get(st, 0)
+        return bits
+
+    def cgpa_bits(self, min_cgpa: float) -> int:
+        """Students with CGPA ≥ min_cgpa (one bisect, packed once per threshold)."""
+        bits = self._cgpa_cache.get(min_cgpa)
+        if bits is None:
+            start = bisect_left(self._cgpas, min_cgpa)
+            bits = self._cgpa_cache[min_cgpa] = _pack(self._by_cgpa[start:], len(self.students))
+        return bits
+
+    def eligible(self, criteria: dict | None) -> int:
+        """
+        Bitset of students satisfying `criteria`; missing/empty rules don't filter.
+
+        criteria keys: branches (list), min_cgpa (float), exclude_status (list)
+        """
+        bits = self.all_bits
+        if not criteria:
+            return bits
+        if criteria.get("branches"):
+            bits &= self.branch_bits(criteria["branches"])
+        if criteria.get("min_cgpa"):
+            bits &= self.cgpa_bits(criteria["min_cgpa"])
+        if criteria.get("exclude_status"):
+            bits &= ~self.status_bits(criteria["exclude_status"])
+        return bits
+
+    @staticmethod
+    def count(bits: int) -> int:
+        return bits.bit_count()
+
+    def select(self, bits: int) -> list[dict]:
+        """Students whose bit is set, in cohort order (decoded a byte at a time)."""
+        students, out = self.students, []
+        for byte_no, byte in enumerate(bits.to_bytes((len(students) + 7) >> 3, "little")):
+            if byte:
+                base = byte_no << 3
+                out.extend(students[base + i] for i in _BYTE_BITS[byte])
+        return out
+
+
+def describe(criteria: dict | None) -> str:
+    """Short human-readable form of a job's eligibility rules."""
+    if not criteria:
+        return "Open to all"
+    parts = []
+    if criteria.get("branches"):
+        parts.append("/".join(criteria["branches"]) + " only")
+    if criteria.get("min_cgpa"):
+        parts.append(f"CGPA ≥ {criteria['min_cgpa']}")
+    if criteria.get("exclude_status"):
+        parts.append("not " + ", ".join(criteria["exclude_status"]).lower())
+    return ", ".join(parts) or "Open to all"
@@ -0,0 +1,77 @@
+"""
+eval_lsa.py  —  Offline comparison of LSA vs TF-IDF student rankings
+--------------------------------------------------------------------
+For every job in the catalog (jobs.jsonl), ranks the cohort with the default
+TF-IDF engine and with SmartMatchEngine(mode="lsa"), then reports how far the LSA
+ranking agrees with the TF-IDF one (Spearman ρ, top-k overlap) alongside
+scoring time and per-document vector size.
+
+Jobs come from catalog.load_jobs(); SAMPLE_STUDENTS is read from app.py's
+source with ast, so the script runs without Streamlit installed.
+
+Usage:
+    python eval_lsa.py                          # students.csv + SAMPLE_STUDENTS
+    python eval_lsa.py --dim 32 --synthetic 2000
+    python eval_lsa.py --backend python         # force the pure-Python SVD
+"""
+
+import argparse
+import statistics
+import time
+
+from catalog import load_jobs
+from ml_model import SmartMatchEngine
+from rank_agreement import load_cohort, spearman, top_k_overlap
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="extra random profiles drawn from job skills")
+    parser.add_argument("--backend", choices=["auto", "numpy", "python"], default="auto")
+    parser.add_argument("--k", type=int, default=5, help="top-k for overlap")
+    parser.add_argument("--catalog", default="jobs.jsonl", help="job catalog (CSV or JSONL)")
+    args = parser.parse_args()
+
+    jobs      = load_jobs(args.catalog)
+    job_texts = [" ".join(j["skills"]) for j in jobs]
+    profiles  = load_cohort(args.synthetic, jobs)
+
+    tfidf = SmartMatchEngine()
+    lsa   = SmartMatchEngine(mode="lsa", lsa_dim=args.dim)
+    t = time.perf_counter()
+    lsa.fit(job_texts + profiles, backend=args.backend)
+    fit_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    tf_scores = [tfidf.batch_scores(p, job_texts) for p in profiles]
+    tf_s = time.perf_counter() - t
+    t = time.perf_counter()
+    lsa_scores = [lsa.batch_scores(p, job_texts) for p in profiles]
+    lsa_s = time.perf_counter() - t
+
+    k = min(args.k, len(profiles))
+    print("─" * 72)
+    print(f"{len(profiles)} profiles × {len(jobs)} jobs | LSA dim {lsa._lsa.dim} "
+          f"({lsa._lsa.backend} SVD, fit {fit_s * 1000:.0f} ms)")
+    print("─" * 72)
+    print(f"{'Job':<40}{'Spearman ρ':>14}{f'top-{k} overlap':>16}")
+    print("─" * 72)
+    rhos, overlaps = [], []
+    for j, job in enumerate(jobs):
+        a = [row[j] for row in tf_scores]
+        b = [row[j] for row in lsa_scores]
+        rhos.append(spearman(a, b))
+        overlaps.append(top_k_overlap(a, b, k))
+        label = f"{job['title']} @ {job['company']}"
+        print(f"{label[:39]:<40}{rhos[-1]:>14.3f}{overlaps[-1]:>16.0%}")
+    print("─" * 72)
+    print(f"{'mean':<40}{statistics.fmean(rhos):>14.3f}{statistics.fmean(overlaps):>16.0%}")
+    print(f"scoring time   TF-IDF {tf_s * 1000:8.1f} ms   LSA {lsa_s * 1000:8.1f} ms")
+    print(f"vector size    LSA {lsa._lsa.dim * 4} bytes/doc (array('f') × {lsa._lsa.dim})")
+    print("─" * 72)
+
+
+if __name__ == "__main__":
+    main()
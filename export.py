@@ -0,0 +1,143 @@
+"""
+export.py  —  Streaming export of scored cohorts to CSV / JSONL
+---------------------------------------------------------------
+Scores students × selected jobs one student at a time and streams the rows
+out in encoded chunks, so the full scored list never exists in memory.
+
+    rows   = iter_scored_rows(students, jobs, top_k=5, threshold=40)
+    chunks = iter_csv(rows)            # or iter_jsonl(rows)
+    for chunk in chunks:               # bytes, ~64 KB each
+        out.write(chunk)
+
+Filters are applied during the stream: `threshold` drops rows as they are
+scored; `top_k` keeps a k-sized min-heap per job (O(k · jobs) memory) and
+emits each job's best rows once the cohort has been read.
+
+CLI:
+    python export.py --format jsonl --top-k 5 > scored.jsonl
+    python export.py --students students.csv --jobs 1,2,3 --threshold 50
+    python export.py --catalog jobs.csv --top-k 10
+"""
+
+import csv
+import heapq
+import io
+import itertools
+import json
+from typing import Callable, Iterable, Iterator
+
+from ml_model import ml_fit_score
+
+EXPORT_FIELDS = ["Job ID", "Job", "Job Company", "Rank", "ML Fit Score (%)",
+                 "Name", "Branch", "CGPA", "Skills", "Status", "Company"]
+
+
+def iter_scored_rows(students: Iterable[dict], jobs: list[dict],
+                     top_k: int | None = None,
+                     threshold: float | None = None,
+                     scorer: Callable[[dict, list[dict]], list[int]] | None = None) -> Iterator[dict]:
+    """
+    Yield one export row per (student, job) pair.
+
+    Without top_k rows come out in cohort order as soon as each student is
+    scored. With top_k, rows are grouped by job, best first, with Rank set.
+    `scorer(student, jobs)` replaces the default ml_fit_score call, e.g.
+    with a cached Cohort.row_scores.
+    """
+    if scorer is None:
+        job_texts = [" ".join(j["skills"]) for j in jobs]
+        scorer = lambda s, _: ml_fit_score(s["Skills"].replace(",", " ").lower(), job_texts)
+    heaps: list[list] = [[] for _ in jobs]
+    seq = itertools.count()                       # heap tie-breaker
+
+    for s in students:
+        scores = scorer(s, jobs)
+        for job, heap, score in zip(jobs, heaps, scores):
+            if threshold is not None and score < threshold:
+                continue
+            row = {"Job ID": job["id"], "Job": job["title"], "Job Company": job["company"],
+                   "Rank": None, "ML Fit Score (%)": score,
+                   **{k: s.get(k) for k in ("Name", "Branch", "CGPA", "Skills", "Status", "Company")}}
+            if top_k is None:
+                yield row
+            elif len(heap) < top_k:
+                heapq.heappush(heap, (score, -next(seq), row))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, -next(seq), row))
+
+    if top_k is not None:
+        for heap in heaps:
+            for rank, (_, _, row) in enumerate(sorted(heap, reverse=True), 1):
+                row["Rank"] = rank
+                yield row
+
+
+def _chunked(lines: Iterator[str], chunk_bytes: int) -> Iterator[bytes]:
+    buf, size = [], 0
+    for line in lines:
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def iter_csv(rows: Iterable[dict], chunk_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """Encode rows as CSV (header first) in chunks of roughly chunk_bytes."""
+    def lines() -> Iterator[str]:
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            if out.tell() >= 4096:
+                yield out.getvalue()
+                out.seek(0)
+                out.truncate()
+        yield out.getvalue()
+    return _chunked(lines(), chunk_bytes)
+
+
+def iter_jsonl(rows: Iterable[dict], chunk_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """Encode rows as JSON Lines in chunks of roughly chunk_bytes."""
+    return _chunked((json.dumps(row, ensure_ascii=False) + "\n" for row in rows), chunk_bytes)
+
+
+def iter_students_csv(path: str) -> Iterator[dict]:
+    """Stream students from a CSV with the Placement Cell upload columns."""
+    with open(path, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield {
+                "Name":    row.get("Name", "").strip(),
+                "Branch":  row.get("Branch", "").strip(),
+                "CGPA":    float(row.get("CGPA", 0)),
+                "Skills":  row.get("Skills", "").strip(),
+                "Status":  row.get("Status", "Applied").strip(),
+                "Company": row.get("Company", "-").strip(),
+            }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from catalog import load_jobs
+
+    parser = argparse.ArgumentParser(description="Stream a scored cohort to stdout.")
+    parser.add_argument("--students", default="students.csv")
+    parser.add_argument("--catalog", default="jobs.jsonl", help="job catalog (CSV or JSONL)")
+    parser.add_argument("--jobs", help="comma-separated job ids (default: all)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--top-k", type=int)
+    parser.add_argument("--threshold", type=float)
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.catalog)
+    if args.jobs:
+        wanted = {int(x) for x in args.jobs.split(",")}
+        jobs = [j for j in jobs if j["id"] in wanted]
+    rows = iter_scored_rows(iter_students_csv(args.students), jobs, args.top_k, args.threshold)
+    for chunk in (iter_jsonl if args.format == "jsonl" else iter_csv)(rows):
+        sys.stdout.buffer.write(chunk)
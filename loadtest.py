@@ -0,0 +1,236 @@
+"""
+loadtest.py  —  Multi-session rerun-latency harness for app.py
+--------------------------------------------------------------
+Simulates N concurrent users against one in-process copy of app.py with
+Streamlit's headless AppTest runner (one AppTest = one browser session).
+Each session logs in with a demo account from USERS and replays the same
+interactions a real user would:
+
+    student : type skills → move score slider → Apply to a job → "Why I Match?"
+    cell    : switch the dashboard job → run a recruiter search
+
+Gemini is replaced by a local stub (fixed latency, canned text), so runs are
+offline and repeatable. For each concurrency level the harness reports rerun
+latency percentiles, throughput (reruns/s) and traced memory per session.
+
+With --count-work it also prints, per interaction, which app sections
+(count_section() tallies in app.py) re-executed. AppTest reruns the whole
+script on every interaction, so these tallies measure full-rerun cost, not
+fragment isolation; test_fragments.py checks which sections each
+interaction reruns in a real browser session.
+
+Usage:
+    python loadtest.py                         # levels 1,2,4,8
+    python loadtest.py --levels 1,4,16,32 --rounds 5 --gemini-ms 800
+    python loadtest.py --no-memory             # skip the tracemalloc pass
+    python loadtest.py --levels 1 --count-work # sections run per interaction
+"""
+
+import argparse
+import gc
+import importlib
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from app_literals import load_app_literal
+
+USERS = load_app_literal("USERS")
+STUDENT_ACCOUNTS = [(u, v[0]) for u, v in USERS.items() if v[1] == "student"]
+CELL_ACCOUNTS    = [(u, v[0]) for u, v in USERS.items() if v[1] == "cell"]
+SKILL_SETS = [
+    "Python, Machine Learning, XGBoost, Scikit-learn, SQL, Pandas, NLP",
+    "Python, Deep Learning, Computer Vision, PyTorch, CUDA",
+    "Java, Spring Boot, Microservices, Kafka, PostgreSQL",
+    "React, JavaScript, TypeScript, CSS, Redux",
+    "SQL, Python, Power BI, Excel, Statistics",
+]
+SEARCHES = ["pytorch computer vision CGPA > 8", "python machine learning",
+            "java microservices", "react typescript CGPA >= 8"]
+
+
+def install_gemini_stub(latency_ms: float) -> None:
+    """Register a fake google.genai whose Client answers after `latency_ms`."""
+    class _Models:
+        def generate_content(self, model: str, contents: str):
+            time.sleep(latency_ms / 1000)
+            return types.SimpleNamespace(text="Stubbed Gemini answer for load testing.")
+
+    class Client:
+        def __init__(self, api_key: str = ""):
+            self.models = _Models()
+
+    # Import streamlit first: it pulls in google.protobuf, so the real
+    # "google" namespace package exists before the stub is attached to it.
+    importlib.import_module("streamlit.testing.v1")
+
+    genai  = types.ModuleType("google.genai")
+    genai.Client = Client
+    google = sys.modules.setdefault("google", types.ModuleType("google"))
+    google.genai = genai
+    sys.modules["google.genai"] = genai
+
+
+def by_label(widgets, prefix: str):
+    return next(w for w in widgets if w.label.startswith(prefix))
+
+
+class Session:
+    """One simulated user: an AppTest plus the latency of every rerun it did."""
+
+    def __init__(self, idx: int, seed: int):
+        from streamlit.testing.v1 import AppTest
+
+        self.at   = AppTest.from_file("app.py", default_timeout=120)
+        self.rng  = random.Random(seed)
+        self.role = "cell" if idx % 5 == 4 else "student"   # ~1 cell user per 4 students
+        pool = CELL_ACCOUNTS if self.role == "cell" else STUDENT_ACCOUNTS
+        self.username, self.password = pool[idx % len(pool)]
+        self.latencies: list[float] = []
+        self.work: dict[str, list[Counter]] = defaultdict(list)  # interaction → section runs
+
+    def _section_runs(self) -> Counter:
+        try:
+            return Counter(self.at.session_state["section_runs"])
+        except KeyError:
+            return Counter()
+
+    def _run(self, widget=None, action: str = "load") -> None:
+        before = self._section_runs()
+        t = time.perf_counter()
+        (widget or self.at).run()
+        self.latencies.append((time.perf_counter() - t) * 1000)
+        if self.at.exception:
+            raise RuntimeError(f"{self.username}: {self.at.exception[0].message}")
+        self.work[action].append(self._section_runs() - before)
+
+    def login(self) -> None:
+        self._run()
+        sb = self.at.sidebar
+        sb.text_input[0].input(self.username)
+        sb.text_input[1].input(self.password)
+        sb.selectbox[0].select("Placement Cell" if self.role == "cell" else "Student")
+        self._run(sb.button[0].click(), "login")
+
+    def round(self) -> None:
+        if self.role == "student":
+            self._student_round()
+        else:
+            self._cell_round()
+
+    def _student_round(self) -> None:
+        at = self.at
+        self._run(by_label(at.text_input, "⚡ Your Skills").input(self.rng.choice(SKILL_SETS)),
+                  "type skills")
+        self._run(at.slider[0].set_value(self.rng.choice([0, 20, 40, 60])), "move slider")
+        applied = at.session_state["applications"]
+        open_jobs = [b for b in at.button
+                     if b.key and b.key.startswith("apply_")
+                     and not applied.get(int(b.key.split("_")[1]))]
+        if open_jobs:
+            self._run(self.rng.choice(open_jobs).click(), "apply")
+        why = [b for b in at.button if b.key and b.key.startswith("why_btn_")]
+        if why:
+            self._run(self.rng.choice(why).click(), "why I match")
+
+    def _cell_round(self) -> None:
+        at = self.at
+        picker = by_label(at.selectbox, "Select a job to score")
+        self._run(picker.select(self.rng.choice(picker.options)), "switch job")
+        self._run(at.text_input(key="recruiter_query").input(self.rng.choice(SEARCHES)), "search")
+
+
+def run_level(n: int, rounds: int, seed: int) -> tuple[dict, list["Session"]]:
+    """Drive n sessions concurrently; returns latency/throughput stats and the sessions."""
+    sessions = [Session(i, seed + i) for i in range(n)]
+    barrier  = threading.Barrier(n)
+
+    def drive(s: Session) -> None:
+        s.login()
+        barrier.wait()                 # all sessions start interacting together
+        for _ in range(rounds):
+            s.round()
+
+    t = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        for f in [pool.submit(drive, s) for s in sessions]:
+            f.result()
+    wall = time.perf_counter() - t
+
+    lat = sorted(x for s in sessions for x in s.latencies)
+    pct = lambda p: lat[min(len(lat) - 1, int(p / 100 * len(lat)))]
+    return {"reruns": len(lat), "p50": pct(50), "p90": pct(90), "p99": pct(99),
+            "max": lat[-1], "mean": statistics.fmean(lat), "rps": len(lat) / wall}, sessions
+
+
+def print_work(works: list[dict[str, list[Counter]]]) -> None:
+    """Average section executions per interaction, across all sessions."""
+    merged: dict[str, list[Counter]] = defaultdict(list)
+    for work in works:
+        for action, runs in work.items():
+            merged[action].extend(runs)
+    print(f"{'interaction':<16}{'n':>5}  sections executed per rerun (mean)")
+    print("─" * 86)
+    for action, runs in merged.items():
+        total = sum(runs, Counter())
+        parts = ", ".join(f"{name} {count / len(runs):.1f}" for name, count in total.most_common())
+        print(f"{action:<16}{len(runs):>5}  {parts or '-'}")
+    print("─" * 86)
+
+
+def memory_per_session(n: int, seed: int) -> float:
+    """Traced KiB retained per logged-in session after one interaction round."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.take_snapshot()
+    sessions = [Session(i, seed + i) for i in range(n)]
+    for s in sessions:
+        s.login()
+        s.round()
+    gc.collect()
+    grown = sum(d.size_diff for d in tracemalloc.take_snapshot().compare_to(base, "filename"))
+    tracemalloc.stop()
+    del sessions
+    return grown / n / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--levels", default="1,2,4,8",
+                        help="comma-separated concurrent session counts")
+    parser.add_argument("--rounds", type=int, default=3, help="interaction rounds per session")
+    parser.add_argument("--gemini-ms", type=float, default=300, help="stub Gemini latency")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--count-work", action="store_true",
+                        help="print sections executed per interaction")
+    args = parser.parse_args()
+
+    install_gemini_stub(args.gemini_ms)
+    levels = [int(x) for x in args.levels.split(",")]
+
+    print("─" * 86)
+    print(f"{'sessions':>8}{'reruns':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+          f"{'max ms':>10}{'reruns/s':>10}{'KiB/session':>14}")
+    print("─" * 86)
+    works: list[dict[str, list[Counter]]] = []
+    for n in levels:
+        r, sessions = run_level(n, args.rounds, args.seed)
+        works += [s.work for s in sessions]
+        del sessions
+        mem = "-" if args.no_memory else f"{memory_per_session(n, args.seed):.0f}"
+        print(f"{n:>8}{r['reruns']:>8}{r['p50']:>10.1f}{r['p90']:>10.1f}{r['p99']:>10.1f}"
+              f"{r['max']:>10.1f}{r['rps']:>10.1f}{mem:>14}")
+    print("─" * 86)
+    if args.count_work:
+        print_work(works)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@ ml_model.py  —  SmartMatchEngine: Pure-Python TF-IDF with N-grams & Cosine Sim
 ---------------------------------------------------------------------------------------
 No numpy / sklearn required — works on Python 3.14+ without C-extension DLLs.
 Handles bigrams like "machine learning", "data science", "deep learning" properly.
+Known skills are canonicalised first by an Aho-Corasick SkillExtractor, so
+synonyms ("ML" → machine learning) and punctuated names ("Web3.js", "CI/CD")
+match as single skill terms.
 
 API mirrors the sklearn SmartMatchEngine interface requested:
     engine = SmartMatchEngine()
@@ -10,9 +13,14 @@ API mirrors the sklearn SmartMatchEngine interface requested:
     scores = ml_fit_score(student_profile, [job1, job2, ...])         → list[int]
 """
 
+import heapq
 import math
+import random
 import re
-from collections import Counter
+import zlib
+from array import array
+from collections import Counter, deque
+from typing import Iterable
 
 
 # ── Text helpers ─────────────────────────────────────────────────────────────
@@ -42,15 +50,215 @@ def _ngrams(tokens: list[str], n: int) -> list[str]:
     return ["_".join(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
 
 
-def _build_terms(text: str, ngram_range: tuple[int, int] = (1, 2)) -> list[str]:
-    """Tokenise + generate all n-grams in the given range."""
-    tokens = _tokenize(text)
-    terms  = []
+def _build_terms(text: str, ngram_range: tuple[int, int] = (1, 2),
+                 skills: bool = False) -> list[str]:
+    """
+    Tokenise + generate all n-grams in the given range.
+
+    With skills=True, dictionary skills are first pulled out as canonical
+    "skill:<id>" terms and only the remaining text is split into n-grams.
+    """
+    terms: list[str] = []
+    if skills:
+        skill_ids, parts = _skill_extractor.split(text)
+        terms.extend(_SKILL_TERM_PREFIX + s for s in skill_ids)
+    else:
+        parts = [text]
+    # n-grams never span a removed skill: each residual part is tokenised alone
+    token_lists = [_tokenize(part) for part in parts]
     for n in range(ngram_range[0], ngram_range[1] + 1):
-        terms.extend(_ngrams(tokens, n))
+        for tokens in token_lists:
+            terms.extend(_ngrams(tokens, n))
     return terms
 
 
+# ── Skill extraction (Aho-Corasick) ──────────────────────────────────────────
+
+# Canonical skill ID → surface forms seen in profiles and job postings.
+# The canonical form itself is always matched, so list only the extra aliases.
+# Keep aliases distinctive: short forms like "py" or "dl" misfire on prose.
+SKILL_SYNONYMS: dict[str, list[str]] = {
+    "python":            ["python3"],
+    "java":              [],
+    "javascript":        ["js", "ecmascript"],
+    "typescript":        [],
+    "r":                 ["r language", "rstats"],
+    "sql":               ["mysql", "sqlite"],
+    "matlab":            [],
+    "dart":              [],
+    "embedded c":        [],
+    "machine learning":  ["ml", "machine-learning"],
+    "deep learning":     ["deep-learning", "neural networks"],
+    "nlp":               ["natural language processing"],
+    "computer vision":   ["opencv"],
+    "statistics":        ["stats", "statistical analysis"],
+    "linear algebra":    [],
+    "data analysis":     ["data analytics"],
+    "scikit-learn":      ["sklearn", "scikit learn", "scikitlearn"],
+    "xgboost":           ["xgb"],
+    "pandas":            [],
+    "numpy":             [],
+    "tensorflow":        ["tensor flow"],
+    "pytorch":           ["torch"],
+    "transformers":      ["hugging face", "huggingface"],
+    "bert":              [],
+    "cuda":              [],
+    "mlflow":            [],
+    "docker":            [],
+    "kubernetes":        ["k8s"],
+    "ci/cd":             ["ci-cd", "cicd", "ci cd", "continuous integration"],
+    "power bi":          ["powerbi", "power-bi"],
+    "tableau":           [],
+    "excel":             ["ms excel", "microsoft excel"],
+    "spring boot":       ["springboot", "spring-boot"],
+    "microservices":     ["micro services", "microservice"],
+    "kafka":             ["apache kafka"],
+    "postgresql":        ["postgres"],
+    "rest api":          ["rest apis", "restful api"],
+    "react":             ["reactjs", "react.js"],
+    "redux":             [],
+    "next.js":           ["nextjs", "next js"],
+    "node.js":           ["nodejs", "node js"],
+    "css":               ["css3"],
+    "solidity":          [],
+    "ethereum":          [],
+    "web3.js":           ["web3js", "web3"],
+    "smart contracts":   ["smart contract"],
+    "firebase":          [],
+    "flutter":           [],
+    "android":           [],
+    "ios":               [],
+    "iot":               ["internet of things"],
+    "arduino":           [],
+    "raspberry pi":      [],
+    "scada":             [],
+    "cad":               ["autocad"],
+    "simulation":        [],
+}
+
+_SKILL_TERM_PREFIX = "skill:"
+
+
+def _normalise(text: str) -> str:
+    """Lowercase and collapse whitespace so patterns and text share one form."""
+    return re.sub(r"\s+", " ", text.lower())
+
+
+class SkillExtractor:
+    """
+    Aho-Corasick automaton over a canonical skill dictionary with synonyms.
+
+    Every surface form is compiled into one trie with failure links, so
+    extracting skills from a profile or job text is a single linear pass
+    over its characters regardless of dictionary size. Matches must sit on
+    word boundaries ("r" does not fire inside "react"), single-character
+    forms must be set off by spaces or commas ("Python, R" but not "R&D"),
+    and overlapping matches resolve leftmost-longest ("spring boot" wins
+    over "spring").
+
+    Example
+    -------
+    extractor = SkillExtractor(SKILL_SYNONYMS)
+    extractor.extract("Python, ML, Web3.js, CI/CD")
+    # → ['python', 'machine learning', 'web3.js', 'ci/cd']
+    """
+
+    def __init__(self, synonyms: dict[str, list[str]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out:  list[list[tuple[int, str]]] = [[]]   # (pattern length, skill ID)
+
+        for skill_id, aliases in synonyms.items():
+            for form in {skill_id, *aliases}:
+                self._add(_normalise(form).strip(), skill_id)
+        self._link()
+
+    def _add(self, pattern: str, skill_id: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), skill_id))
+
+    def _link(self) -> None:
+        """Breadth-first pass computing failure links and merged outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def _spans(self, text: str) -> list[tuple[int, int, str]]:
+        """Non-overlapping (start, end, skill ID) matches in normalised `text`."""
+        found: list[tuple[int, int, str]] = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, skill_id in self._out[node]:
+                start, end = i - length + 1, i + 1
+                if ((start == 0 or not text[start - 1].isalnum()) and
+                        (end == len(text) or not text[end].isalnum()) and
+                        (length > 1 or self._standalone(text, start, end))):
+                    found.append((start, end, skill_id))
+
+        found.sort(key=lambda m: (m[0], m[0] - m[1]))
+        spans, last_end = [], 0
+        for start, end, skill_id in found:
+            if start >= last_end:
+                spans.append((start, end, skill_id))
+                last_end = end
+        return spans
+
+    @staticmethod
+    def _standalone(text: str, start: int, end: int) -> bool:
+        """Whether text[start:end] is delimited only by spaces, commas or the text ends."""
+        return ((start == 0 or text[start - 1] in " ,") and
+                (end == len(text) or text[end] in " ,"))
+
+    def extract(self, text: str) -> list[str]:
+        """Canonical skill IDs in order of occurrence (repeats kept)."""
+        return [skill_id for _, _, skill_id in self._spans(_normalise(text))]
+
+    def split(self, text: str) -> tuple[list[str], list[str]]:
+        """
+        Return (skill IDs, residual parts): the text between matched spans,
+        each part to be tokenised on its own so no n-gram bridges a skill.
+        """
+        norm  = _normalise(text)
+        spans = self._spans(norm)
+        parts, pos = [], 0
+        for start, end, _ in spans:
+            parts.append(norm[pos:start])
+            pos = end
+        parts.append(norm[pos:])
+        return [skill_id for _, _, skill_id in spans], parts
+
+
+# Compiled once at import — shared by every engine that extracts skills
+_skill_extractor = SkillExtractor(SKILL_SYNONYMS)
+
+
+def _term_label(term: str) -> str:
+    """Human-readable form of a vector term ("skill:ci/cd" → "ci/cd", "data_science" → "data science")."""
+    if term.startswith(_SKILL_TERM_PREFIX):
+        return term[len(_SKILL_TERM_PREFIX):]
+    return term.replace("_", " ")
+
+
 def _tf(terms: list[str]) -> dict[str, float]:
     """Term frequency normalised by document length."""
     counts = Counter(terms)
@@ -83,6 +291,241 @@ def _cosine(a: list[float], b: list[float]) -> float:
     return dot / (na * nb)
 
 
+# ── Feature hashing (vocabulary-free TF-IDF) ─────────────────────────────────
+
+def _hash_feature(term: str, bits: int) -> tuple[int, float]:
+    """Bucket in [0, 2**bits) and ±1 sign of a term; stable across processes."""
+    h = zlib.crc32(term.encode("utf-8"))
+    return h & ((1 << bits) - 1), (-1.0 if h & 0x80000000 else 1.0)
+
+
+def _hashed_tf(terms: list[str], bits: int) -> dict[int, float]:
+    """Signed term frequencies folded into 2**bits buckets (colliding terms tend to cancel)."""
+    total = len(terms) or 1
+    vec: dict[int, float] = {}
+    for t in terms:
+        f, sign = _hash_feature(t, bits)
+        vec[f] = vec.get(f, 0.0) + sign / total
+    return vec
+
+
+def _sparse_cosine(a: dict[int, float], b: dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(w * b.get(f, 0.0) for f, w in a.items())
+    na  = math.sqrt(sum(w * w for w in a.values()))
+    nb  = math.sqrt(sum(w * w for w in b.values()))
+    if na == 0 or nb == 0:
+        return 0.0
+    return dot / (na * nb)
+
+
+class HashedDocumentFrequencies:
+    """
+    Document frequencies of 2**bits hashed features in one array('I').
+
+    Memory is 4 · 2**bits bytes however large the corpus or its vocabulary
+    (1 MiB at the default 18 bits); no term strings are kept.
+    """
+
+    def __init__(self, bits: int):
+        self.bits   = bits
+        self.df     = array("I", [0]) * (1 << bits)
+        self.n_docs = 0
+
+    def add(self, features: Iterable[int]) -> None:
+        """Count one document, given its hashed features."""
+        df = self.df
+        for f in set(features):
+            df[f] += 1
+        self.n_docs += 1
+
+    def idf(self, f: int) -> float:
+        """Smoothed IDF, same formula as _idf()."""
+        return math.log((self.n_docs + 1) / (self.df[f] + 1)) + 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.df.itemsize * len(self.df)
+
+
+# ── Latent semantic analysis (truncated SVD) ─────────────────────────────────
+
+def _orthonormalise(cols: list[list[float]], eps: float = 1e-10) -> list[list[float]]:
+    """Modified Gram-Schmidt; columns that collapse to ~0 (rank deficit) are dropped."""
+    basis: list[list[float]] = []
+    for v in cols:
+        v = list(v)
+        for q in basis:
+            d = sum(a * b for a, b in zip(v, q))
+            v = [a - d * b for a, b in zip(v, q)]
+        norm = math.sqrt(sum(a * a for a in v))
+        if norm > eps:
+            basis.append([a / norm for a in v])
+    return basis
+
+
+def _jacobi_eigh(m: list[list[float]], sweeps: int = 50) -> tuple[list[float], list[list[float]]]:
+    """Eigen-decomposition of a small symmetric matrix by cyclic Jacobi rotations."""
+    n = len(m)
+    a = [row[:] for row in m]
+    v = [[float(i == j) for j in range(n)] for i in range(n)]
+    for _ in range(sweeps):
+        off = sum(a[i][j] ** 2 for i in range(n) for j in range(i + 1, n))
+        if off < 1e-18:
+            break
+        for p in range(n):
+            for q in range(p + 1, n):
+                if abs(a[p][q]) < 1e-15:
+                    continue
+                theta = (a[q][q] - a[p][p]) / (2 * a[p][q])
+                t = math.copysign(1.0, theta) / (abs(theta) + math.sqrt(theta * theta + 1))
+                c = 1 / math.sqrt(t * t + 1)
+                s = t * c
+                for k in range(n):
+                    akp, akq = a[k][p], a[k][q]
+                    a[k][p], a[k][q] = c * akp - s * akq, s * akp + c * akq
+                for k in range(n):
+                    apk, aqk = a[p][k], a[q][k]
+                    a[p][k], a[q][k] = c * apk - s * aqk, s * apk + c * aqk
+                for k in range(n):
+                    vkp, vkq = v[k][p], v[k][q]
+                    v[k][p], v[k][q] = c * vkp - s * vkq, s * vkp + c * vkq
+    return [a[i][i] for i in range(n)], v
+
+
+def _truncated_svd_py(rows: list[dict[int, float]], n_cols: int, k: int,
+                      iters: int = 6, seed: int = 0) -> tuple[list[list[float]], list[float]]:
+    """
+    Top-k right singular vectors and values of a sparse matrix, pure Python.
+
+    Block power iteration on AᵀA (each pass costs O(nnz·k)) followed by a
+    Rayleigh-Ritz step: the k×k Gram matrix of A·Q is diagonalised exactly
+    with Jacobi rotations. Returns (components as k columns of length
+    n_cols, singular values), largest first.
+    """
+    rng = random.Random(seed)
+    q = _orthonormalise([[rng.gauss(0, 1) for _ in range(n_cols)] for _ in range(k)])
+    for _ in range(iters):
+        z = [[0.0] * n_cols for _ in q]
+        for row in rows:
+            y = [sum(w * col[c] for c, w in row.items()) for col in q]
+            for zc, yc in zip(z, y):
+                if yc:
+                    for c, w in row.items():
+                        zc[c] += w * yc
+        q = _orthonormalise(z)
+    if not q:
+        return [], []
+
+    b = [[sum(w * col[c] for c, w in row.items()) for col in q] for row in rows]
+    gram = [[sum(r[i] * r[j] for r in b) for j in range(len(q))] for i in range(len(q))]
+    evals, evecs = _jacobi_eigh(gram)
+    order = sorted(range(len(evals)), key=lambda i: evals[i], reverse=True)
+
+    comps, sigma = [], []
+    for i in order:
+        if evals[i] <= 1e-12:
+            continue
+        comps.append([sum(q[j][c] * evecs[j][i] for j in range(len(q))) for c in range(n_cols)])
+        sigma.append(math.sqrt(evals[i]))
+    return comps, sigma
+
+
+def _truncated_svd_np(np, rows: list[dict[int, float]], n_cols: int, k: int,
+                      iters: int = 4, oversample: int = 10,
+                      seed: int = 0) -> tuple[list[list[float]], list[float]]:
+    """
+    NumPy counterpart of _truncated_svd_py: a randomized range finder.
+
+    A stays sparse (coordinate arrays), so memory is O(nnz + (n + n_cols)·k)
+    rather than a dense n × n_cols matrix. Y = A·Ω is refined by `iters`
+    power passes, and the small l × n_cols matrix B = QᵀA is decomposed exactly.
+    """
+    r_idx = np.fromiter((i for i, row in enumerate(rows) for _ in row), dtype=np.int64)
+    c_idx = np.fromiter((c for row in rows for c in row), dtype=np.int64)
+    vals  = np.fromiter((w for row in rows for w in row.values()), dtype=np.float64)
+
+    def a_dot(x):                      # A · x   (n_cols × l → n × l)
+        out = np.zeros((len(rows), x.shape[1]))
+        np.add.at(out, r_idx, vals[:, None] * x[c_idx])
+        return out
+
+    def at_dot(y):                     # Aᵀ · y  (n × l → n_cols × l)
+        out = np.zeros((n_cols, y.shape[1]))
+        np.add.at(out, c_idx, vals[:, None] * y[r_idx])
+        return out
+
+    l = min(k + oversample, len(rows), n_cols)
+    if l == 0:
+        return [], []
+    q, _ = np.linalg.qr(a_dot(np.random.default_rng(seed).standard_normal((n_cols, l))))
+    for _ in range(iters):
+        z, _ = np.linalg.qr(at_dot(q))
+        q, _ = np.linalg.qr(a_dot(z))
+    _, s, vt = np.linalg.svd(at_dot(q).T, full_matrices=False)
+    keep = [i for i in range(min(k, len(s))) if s[i] > 1e-6]
+    return [vt[i].tolist() for i in keep], [float(s[i]) for i in keep]
+
+
+class LatentSemanticModel:
+    """
+    Truncated-SVD projection of TF-IDF space into `dim` dense dimensions.
+
+    Every term gets a fixed k-float row (array('f')), and a document is
+    folded in as the TF-IDF-weighted sum of its term rows, then unit
+    normalised. Related skills that co-occur across the fitted corpus
+    ("pytorch" / "deep learning") land close together, and a document costs
+    4·k bytes however large the vocabulary grows.
+
+    backend="auto" uses a NumPy randomized SVD when NumPy is installed and
+    the pure-Python block power iteration otherwise. Both approximate the
+    top-k subspace iteratively, so their components agree closely but not
+    exactly. NumPy is only imported here, never for tfidf or hash mode.
+    """
+
+    def __init__(self, corpus: list[list[str]], dim: int = 64, backend: str = "auto"):
+        self.idf   = _idf(corpus)
+        vocab      = sorted(self.idf)
+        col        = {t: i for i, t in enumerate(vocab)}
+        rows = [{col[t]: w * self.idf[t] for t, w in _tf(terms).items()} for terms in corpus]
+
+        np = None
+        if backend in ("auto", "numpy"):
+            try:
+                import numpy as np
+            except ImportError:
+                if backend == "numpy":
+                    raise
+        use_np = np is not None
+        if use_np:
+            comps, sigma = _truncated_svd_np(np, rows, len(vocab), dim)
+        else:
+            comps, sigma = _truncated_svd_py(rows, len(vocab), dim)
+        self.backend = "numpy" if use_np else "python"
+        self.sigma   = sigma
+        self.dim     = len(sigma)
+        self._term_rows = {t: array("f", (c[i] for c in comps)) for t, i in col.items()}
+
+    def embed(self, terms: list[str]) -> array:
+        """Unit-length dense vector (array('f') of self.dim floats) for a document."""
+        vec = [0.0] * self.dim
+        for t, w in _tf(terms).items():
+            row = self._term_rows.get(t)
+            if row is None:
+                continue
+            w *= self.idf[t]
+            for i, x in enumerate(row):
+                vec[i] += w * x
+        norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+        return array("f", (x / norm for x in vec))
+
+
+def _dense_cosine(a: array, b: array) -> float:
+    """Cosine of two unit vectors from LatentSemanticModel.embed()."""
+    return max(0.0, sum(x * y for x, y in zip(a, b)))
+
+
 # ── SmartMatchEngine ─────────────────────────────────────────────────────────
 
 class SmartMatchEngine:
@@ -90,15 +533,105 @@ class SmartMatchEngine:
     Drop-in pure-Python equivalent of the sklearn-based SmartMatchEngine.
     Uses TF-IDF with bigrams (ngram_range=(1,2)) and cosine similarity.
 
+    With extract_skills=True (default) known skills and their synonyms are
+    canonicalised by SkillExtractor first, so "ML" matches "machine learning"
+    and "Web3.js" / "CI/CD" stay single terms instead of splitting apart.
+
+    mode="lsa" scores by dense cosine in a truncated-SVD space instead
+    (see LatentSemanticModel). Call fit() on the job-plus-profile corpus
+    first; an unfitted LSA engine fits on the texts of each call.
+
+    mode="hash" is TF-IDF over 2**hash_bits signed hashed features: no
+    vocabulary is built, and fit() streams a corpus into a fixed-size
+    document-frequency array (HashedDocumentFrequencies) whose IDF is then
+    used for every call. Unfitted, IDF comes from each call's texts exactly
+    as in tfidf mode, so scores only differ where terms collide.
+
     Example
     -------
     engine = SmartMatchEngine()
     score  = engine.get_fit_score(student_profile, job_description)
     # → 95.0  (float, 0-100 scale)
+
+    lsa = SmartMatchEngine(mode="lsa", lsa_dim=64).fit(jobs + profiles)
+    lsa.batch_scores(profile, jobs)
+
+    hashed = SmartMatchEngine(mode="hash", hash_bits=18).fit(iter_profiles())
+    hashed.batch_scores(profile, jobs)
     """
 
-    def __init__(self, ngram_range: tuple[int, int] = (1, 2)):
-        self.ngram_range = ngram_range
+    def __init__(self, ngram_range: tuple[int, int] = (1, 2),
+                 extract_skills: bool = True,
+                 mode: str = "tfidf", lsa_dim: int = 64, hash_bits: int = 18):
+        if mode not in ("tfidf", "lsa", "hash"):
+            raise ValueError(f"unknown mode {mode!r} (expected 'tfidf', 'lsa' or 'hash')")
+        if not 1 <= hash_bits <= 30:
+            raise ValueError(f"hash_bits must be in 1..30, got {hash_bits}")
+        self.ngram_range    = ngram_range
+        self.extract_skills = extract_skills
+        self.mode           = mode
+        self.lsa_dim        = lsa_dim
+        self.hash_bits      = hash_bits
+        self._df: HashedDocumentFrequencies | None = None
+        self._lsa: LatentSemanticModel | None = None
+        self._embed_cache: dict[str, array] = {}
+
+    def _terms(self, text: str) -> list[str]:
+        return _build_terms(text, self.ngram_range, self.extract_skills)
+
+    def tokenize(self, text: str) -> list[str]:
+        """Terms this engine builds for `text`; pass them back as batch_scores(job_terms=...)."""
+        return self._terms(text)
+
+    def fit(self, corpus: Iterable[str], backend: str = "auto") -> "SmartMatchEngine":
+        """
+        Fit the LSA projection on job + profile texts, or stream the corpus
+        into hashed document frequencies in hash mode (no-op in tfidf mode).
+        """
+        if self.mode == "hash":
+            self._df = HashedDocumentFrequencies(self.hash_bits)
+            for text in corpus:
+                self._df.add(_hashed_tf(self._terms(text), self.hash_bits))
+        elif self.mode == "lsa":
+            self._lsa = LatentSemanticModel([self._terms(t) for t in corpus],
+                                            self.lsa_dim, backend)
+            self._embed_cache.clear()
+        return self
+
+    def embed(self, text: str) -> array:
+        """Dense LSA vector for `text`; cached, since job texts repeat across calls."""
+        if self._lsa is None:
+            raise RuntimeError("embed() needs a fitted LSA engine — call fit() first")
+        vec = self._embed_cache.get(text)
+        if vec is None:
+            if len(self._embed_cache) >= 4096:
+                self._embed_cache.clear()
+            vec = self._embed_cache[text] = self._lsa.embed(self._terms(text))
+        return vec
+
+    def _lsa_scores(self, student_profile: str, job_descriptions: list[str]) -> list[float]:
+        if self._lsa is None:
+            model = LatentSemanticModel(
+                [self._terms(t) for t in [student_profile] + job_descriptions], self.lsa_dim)
+            embed = lambda t: model.embed(self._terms(t))
+        else:
+            embed = self.embed
+        sv = embed(student_profile)
+        return [round(_dense_cosine(sv, embed(j)) * 100, 2) for j in job_descriptions]
+
+    def _hash_scores(self, student_profile: str,
+                     job_terms: list[list[str]]) -> list[float]:
+        bits = self.hash_bits
+        vecs = [_hashed_tf(terms, bits) for terms in [self._terms(student_profile)] + job_terms]
+        if self._df is not None:
+            idf = self._df.idf
+        else:
+            df = Counter(f for v in vecs for f in v)
+            n  = len(vecs)
+            idf = lambda f: math.log((n + 1) / (df[f] + 1)) + 1
+        sv, *jvs = [{f: w * idf(f) for f, w in v.items()} for v in vecs]
+        # Signed collisions can push a cosine slightly below zero; scores stay 0-100
+        return [round(max(_sparse_cosine(sv, jv), 0.0) * 100, 2) for jv in jvs]
 
     def get_fit_score(self, student_profile: str, job_description: str) -> float:
         """
@@ -109,8 +642,12 @@ class SmartMatchEngine:
         -------
         float : score in [0, 100] rounded to 2 decimal places.
         """
-        s_terms = _build_terms(student_profile, self.ngram_range)
-        j_terms = _build_terms(job_description, self.ngram_range)
+        if self.mode == "lsa":
+            return self._lsa_scores(student_profile, [job_description])[0]
+        if self.mode == "hash":
+            return self._hash_scores(student_profile, [self._terms(job_description)])[0]
+        s_terms = self._terms(student_profile)
+        j_terms = self._terms(job_description)
 
         idf   = _idf([s_terms, j_terms])
         vocab = sorted(idf.keys())
@@ -121,10 +658,21 @@ class SmartMatchEngine:
         return round(_cosine(sv, jv) * 100, 2)
 
     def batch_scores(self, student_profile: str,
-                     job_descriptions: list[str]) -> list[float]:
-        """Score one student against multiple job descriptions efficiently."""
-        all_terms = [_build_terms(t, self.ngram_range)
-                     for t in [student_profile] + job_descriptions]
+                     job_descriptions: list[str],
+                     job_terms: list[list[str]] | None = None) -> list[float]:
+        """
+        Score one student against multiple job descriptions efficiently.
+
+        `job_terms`, if given, are the jobs' pre-tokenized terms (from
+        tokenize(), e.g. cached by catalog.JobCatalog) and skip re-tokenizing.
+        """
+        if self.mode == "lsa":
+            return self._lsa_scores(student_profile, job_descriptions)
+        if job_terms is None:
+            job_terms = [self._terms(t) for t in job_descriptions]
+        if self.mode == "hash":
+            return self._hash_scores(student_profile, job_terms)
+        all_terms = [self._terms(student_profile)] + job_terms
         idf   = _idf(all_terms)
         vocab = sorted(idf.keys())
 
@@ -133,6 +681,216 @@ class SmartMatchEngine:
         return [round(_cosine(sv, vectors[i + 1]) * 100, 2)
                 for i in range(len(job_descriptions))]
 
+    def explain(self, student_profile: str, job_description: str, k: int = 3,
+                corpus: list[str] | None = None,
+                corpus_terms: list[list[str]] | None = None) -> dict:
+        """
+        Break a TF-IDF fit score down into per-term contributions.
+
+        The cosine is a sum over shared terms of s[t]·j[t] / (|s|·|j|), so each
+        shared term's share of the score falls straight out of the sparse
+        vectors — no model call needed. Always uses TF-IDF, even in lsa/hash mode.
+
+        IDF depends on the documents scored together. Pass the job texts given
+        to batch_scores() as `corpus` (or their pre-tokenized `corpus_terms`)
+        so the points add up to the score shown for this job; without it IDF
+        covers just the student and this one job, as in get_fit_score().
+
+        Returns
+        -------
+        dict with
+            score   : float, same value as batch_scores() over `corpus` in tfidf mode
+            shared  : [(term, points)] top-k shared terms, points summing to ≤ score
+            missing : [term] job terms absent from the profile, most important first
+        """
+        s_terms = self._terms(student_profile)
+        j_terms = self._terms(job_description)
+        if corpus_terms is None:
+            corpus_terms = [self._terms(t) for t in corpus] if corpus is not None else [j_terms]
+        idf = _idf([s_terms] + corpus_terms)
+        sv  = {t: w * idf[t] for t, w in _tf(s_terms).items()}
+        jv  = {t: w * idf[t] for t, w in _tf(j_terms).items()}
+        norm = math.sqrt(sum(x * x for x in sv.values())) * math.sqrt(sum(x * x for x in jv.values()))
+
+        contrib = {t: sv[t] * jv[t] / norm * 100 for t in sv.keys() & jv.keys()} if norm else {}
+        shared  = heapq.nlargest(k, contrib.items(), key=lambda kv: kv[1])
+        missing = sorted((t for t in jv if t not in sv), key=lambda t: -jv[t])
+        # Different terms can share a label (skill ID vs. bigram); keep the first
+        labels  = [_term_label(t) for t in missing]
+        missing = [l for i, l in enumerate(labels) if l not in labels[:i]]
+        return {
+            "score":   round(sum(contrib.values(), 0.0), 2),
+            "shared":  [(_term_label(t), round(v, 2)) for t, v in shared],
+            "missing": missing,
+        }
+
+
+# ── Recruiter search (BM25 over an inverted index) ───────────────────────────
+
+# "cgpa > 8", "CGPA>=7.5" … — numeric comparisons embedded in a free-text query
+_FILTER_RE = re.compile(r"\b([a-z]+)\s*(>=|<=|>|<|=)\s*(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+_FILTER_OPS = {
+    ">":  lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<":  lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "=":  lambda a, b: a == b,
+}
+
+
+def parse_query(query: str) -> tuple[str, list[tuple[str, str, float]]]:
+    """
+    Split a recruiter query into free text and numeric filters.
+
+    parse_query("pytorch computer vision CGPA > 8")
+    # → ('pytorch computer vision', [('cgpa', '>', 8.0)])
+    """
+    filters = [(f.lower(), op, float(v)) for f, op, v in _FILTER_RE.findall(query)]
+    return _FILTER_RE.sub(" ", query).strip(), filters
+
+
+class StudentIndex:
+    """
+    Inverted index over student skills with Okapi BM25 ranking.
+
+    An alternative to the TF-IDF cosine for ad-hoc recruiter queries over
+    the whole cohort: only students sharing at least one query term are
+    touched, numeric filters are checked on that candidate set, and the
+    top k come out of a heap rather than a full sort.
+
+    sync() diffs a new student list against the indexed one by Name, so a
+    CSV re-upload only re-indexes rows whose Skills actually changed.
+
+    Example
+    -------
+    index = StudentIndex()
+    index.sync(students)
+    index.search("pytorch computer vision CGPA > 8", k=5)
+    # → [(7.41, {...student...}), ...]
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75,
+                 ngram_range: tuple[int, int] = (1, 1)):
+        self.k1          = k1
+        self.b           = b
+        self.ngram_range = ngram_range
+        self._postings:  dict[str, dict[int, int]] = {}   # term → {doc: tf}
+        self._doc_terms: dict[int, Counter] = {}
+        self._doc_len:   dict[int, int] = {}
+        self._students:  dict[int, dict] = {}
+        self._by_name:   dict[str, tuple[int, str]] = {}   # Name → (doc, indexed Skills)
+        self._fields:    dict[str, str] = {}                # lowercased → actual key
+        self._total_len  = 0
+        self._next_doc   = 0
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    @staticmethod
+    def _content_key(student: dict) -> str:
+        """Only Skills are indexed; other fields are read live at filter time."""
+        return student.get("Skills", "")
+
+    def add(self, student: dict) -> None:
+        """Index one student, replacing any existing entry with the same Name."""
+        self.remove(student["Name"])
+        doc = self._next_doc
+        self._next_doc += 1
+        terms = Counter(_build_terms(student.get("Skills", ""), self.ngram_range, skills=True))
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc] = tf
+        self._doc_terms[doc] = terms
+        self._doc_len[doc]   = sum(terms.values())
+        self._students[doc]  = student
+        self._fields.update((f.lower(), f) for f in student)
+        self._by_name[student["Name"]] = (doc, self._content_key(student))
+        self._total_len += self._doc_len[doc]
+
+    def remove(self, name: str) -> None:
+        entry = self._by_name.pop(name, None)
+        if entry is None:
+            return
+        doc   = entry[0]
+        terms = self._doc_terms.pop(doc)
+        for term in terms:
+            posting = self._postings[term]
+            del posting[doc]
+            if not posting:
+                del self._postings[term]
+        del self._students[doc]
+        self._total_len -= self._doc_len.pop(doc)
+
+    def sync(self, students: list[dict]) -> tuple[int, int]:
+        """
+        Make the index match `students`, touching only what changed.
+
+        Returns
+        -------
+        (re-indexed, removed) : counts of students added/changed and dropped.
+        """
+        incoming = {s["Name"]: s for s in students}
+        stale = [name for name in self._by_name if name not in incoming]
+        for name in stale:
+            self.remove(name)
+        changed = 0
+        for name, student in incoming.items():
+            entry = self._by_name.get(name)
+            if entry is None or entry[1] != self._content_key(student):
+                self.add(student)
+                changed += 1
+            else:
+                self._students[entry[0]] = student      # status/CGPA edits: no re-index
+        return changed, len(stale)
+
+    def search(self, query: str, k: int = 10,
+               filters: list[tuple[str, str, float]] | None = None) -> list[tuple[float, dict]]:
+        """
+        Top-k students for `query`, best first, as (BM25 score, student) pairs.
+
+        Numeric filters may be written inline ("CGPA > 8") or passed as
+        (field, op, value) tuples; field names match student keys
+        case-insensitively. A filter-only query returns matches in index order
+        with score 0.
+        """
+        text, inline = parse_query(query)
+        filters = [(self._fields.get(f.lower()), _FILTER_OPS[op], v)
+                   for f, op, v in inline + list(filters or [])]
+        terms   = set(_build_terms(text, self.ngram_range, skills=True))
+
+        def passes(student: dict) -> bool:
+            for key, op, value in filters:
+                try:
+                    if key is None or not op(float(student[key]), value):
+                        return False
+                except (KeyError, TypeError, ValueError):
+                    return False
+            return True
+
+        if not terms:
+            hits = (s for s in self._students.values() if passes(s))
+            return [(0.0, s) for _, s in zip(range(k), hits)] if filters else []
+
+        n       = len(self._students)
+        avg_dl  = self._total_len / n if n else 1.0
+        base    = self.k1 * (1 - self.b)
+        slope   = self.k1 * self.b / (avg_dl or 1.0)
+        doc_len = self._doc_len
+        scores: dict[int, float] = {}
+        for term in terms:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf  = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            gain = idf * (self.k1 + 1)
+            for doc, tf in posting.items():
+                scores[doc] = scores.get(doc, 0.0) + gain * tf / (tf + base + slope * doc_len[doc])
+
+        candidates = ((sc, doc) for doc, sc in scores.items()
+                      if not filters or passes(self._students[doc]))
+        top = heapq.nlargest(k, candidates)
+        return [(round(sc, 4), self._students[doc]) for sc, doc in top]
+
 
 # ── Convenience function (backward-compatible) ────────────────────────────────
 
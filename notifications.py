@@ -0,0 +1,164 @@
+"""
+notifications.py  —  In-process notification bus with bounded per-user queues
+-----------------------------------------------------------------------------
+One bus is shared by every session in the app process.
+
+    bus = NotificationBus(capacity=100, db_path="notifications.db")
+    bus.publish("ashutosh", "✅ Applied to ML Engineer at Flipkart!")
+    bus.broadcast("📢 Google India drive - Sept 5", branches={"CSE", "IT"}, cgpa_min=8.0)
+    items, cursor = bus.read("ashutosh", branch="CSE", cgpa=8.5, after=cursor)
+
+Design
+------
+* Every message gets a global, monotonically increasing sequence number;
+  readers keep the last one they saw as a cursor and only fetch newer items.
+* Personal messages go into a per-user ring buffer (deque(maxlen=capacity)),
+  so memory per user is bounded and old items fall off in O(1).
+* Broadcasts are appended once to a shared ring buffer together with their
+  segment (branches, CGPA band). Publishing is O(1) whatever the audience
+  size; each reader filters the broadcast log against its own profile when
+  it reads.
+* With db_path set, every message is also written to SQLite and the most
+  recent `capacity` items per queue are reloaded on start-up.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Iterable
+
+BROADCAST = "*"        # queue key of the shared broadcast log
+
+
+class Notification:
+    """One message; segment fields are only set on broadcasts."""
+
+    __slots__ = ("seq", "ts", "user", "text", "branches", "cgpa_min", "cgpa_max")
+
+    def __init__(self, seq: int, ts: float, user: str, text: str,
+                 branches: frozenset[str] | None = None,
+                 cgpa_min: float | None = None, cgpa_max: float | None = None):
+        self.seq      = seq
+        self.ts       = ts
+        self.user     = user
+        self.text     = text
+        self.branches = branches
+        self.cgpa_min = cgpa_min
+        self.cgpa_max = cgpa_max
+
+    def reaches(self, branch: str | None, cgpa: float | None) -> bool:
+        """Whether a broadcast's segment includes a student with this profile."""
+        if self.branches is not None and (branch or "").upper() not in self.branches:
+            return False
+        if self.cgpa_min is not None and (cgpa is None or cgpa < self.cgpa_min):
+            return False
+        if self.cgpa_max is not None and (cgpa is None or cgpa > self.cgpa_max):
+            return False
+        return True
+
+
+class NotificationBus:
+    """Thread-safe pub/sub of notifications with cursor-based incremental reads."""
+
+    def __init__(self, capacity: int = 100, db_path: str | None = None):
+        self.capacity = capacity
+        self._queues: dict[str, deque[Notification]] = {BROADCAST: deque(maxlen=capacity)}
+        self._seq  = 0
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if db_path:
+            self._open_db(db_path)
+
+    # ── persistence ─────────────────────────────────────────────────────────
+    def _open_db(self, path: str) -> None:
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS notifications ("
+            " seq INTEGER PRIMARY KEY, ts REAL, user TEXT, text TEXT,"
+            " branches TEXT, cgpa_min REAL, cgpa_max REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS notifications_user ON notifications(user, seq)")
+        rows = self._db.execute(
+            "SELECT seq, ts, user, text, branches, cgpa_min, cgpa_max FROM ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY user ORDER BY seq DESC) AS rn"
+            "  FROM notifications) WHERE rn <= ? ORDER BY seq", (self.capacity,))
+        for seq, ts, user, text, branches, lo, hi in rows:
+            segment = frozenset(branches.split(",")) if branches else None
+            self._queue(user).append(Notification(seq, ts, user, text, segment, lo, hi))
+            self._seq = max(self._seq, seq)
+
+    def _persist(self, n: Notification) -> None:
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT INTO notifications VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (n.seq, n.ts, n.user, n.text,
+             ",".join(sorted(n.branches)) if n.branches is not None else None,
+             n.cgpa_min, n.cgpa_max))
+        self._db.commit()
+
+    # ── publishing ──────────────────────────────────────────────────────────
+    def _queue(self, user: str) -> deque[Notification]:
+        q = self._queues.get(user)
+        if q is None:
+            q = self._queues[user] = deque(maxlen=self.capacity)
+        return q
+
+    def _append(self, user: str, text: str, **segment) -> int:
+        with self._lock:
+            self._seq += 1
+            n = Notification(self._seq, time.time(), user, text, **segment)
+            self._queue(user).append(n)
+            self._persist(n)
+            return n.seq
+
+    def publish(self, user: str, text: str) -> int:
+        """Send a message to one user; returns its sequence number."""
+        return self._append(user, text)
+
+    def broadcast(self, text: str, branches: Iterable[str] | None = None,
+                  cgpa_min: float | None = None, cgpa_max: float | None = None) -> int:
+        """
+        Send a message to every student, or to a segment of them.
+
+        Stored once regardless of audience size; `branches` (e.g. {"CSE", "IT"})
+        and the CGPA band are matched against each reader's profile at read time.
+        """
+        segment = frozenset(b.upper() for b in branches) if branches else None
+        return self._append(BROADCAST, text, branches=segment,
+                            cgpa_min=cgpa_min, cgpa_max=cgpa_max)
+
+    # ── reading ─────────────────────────────────────────────────────────────
+    @staticmethod
+    def _newer(q: deque[Notification], after: int) -> list[Notification]:
+        """Items with seq > after, oldest first — walks only the new tail."""
+        out = []
+        for n in reversed(q):
+            if n.seq <= after:
+                break
+            out.append(n)
+        out.reverse()
+        return out
+
+    def read(self, user: str, branch: str | None = None, cgpa: float | None = None,
+             after: int = 0) -> tuple[list[Notification], int]:
+        """
+        New notifications for `user` since cursor `after`, oldest first,
+        plus the cursor to pass next time.
+        """
+        with self._lock:
+            personal  = self._newer(self._queues.get(user, ()), after)
+            broadcast = [n for n in self._newer(self._queues[BROADCAST], after)
+                         if n.reaches(branch, cgpa)]
+            cursor = self._seq
+        items = sorted(personal + broadcast, key=lambda n: n.seq)
+        return items[-self.capacity:], cursor
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the newest message published so far."""
+        return self._seq
+
+    def count(self, user: str) -> int:
+        """Personal messages currently held for `user` (broadcasts excluded)."""
+        return len(self._queues.get(user, ()))
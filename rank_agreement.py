@@ -0,0 +1,56 @@
+"""
+rank_agreement.py  —  Shared cohort and rank-agreement helpers for offline scripts
+----------------------------------------------------------------------------------
+eval_lsa.py and bench_hashing.py both rank a cohort of profiles per job with
+two engines and report how far the rankings agree. The cohort loader and the
+agreement measures live here so neither script imports the other.
+
+    profiles = load_cohort(synthetic=0, jobs=jobs)
+    spearman(a, b), top_k_overlap(a, b, k=5)     # a, b: scores per profile
+"""
+
+import csv
+import random
+import statistics
+
+from app_literals import load_app_literal
+
+
+def load_cohort(synthetic: int, jobs: list[dict]) -> list[str]:
+    """SAMPLE_STUDENTS + students.csv skills, plus `synthetic` random profiles from job skills."""
+    profiles = [s["Skills"] for s in load_app_literal("SAMPLE_STUDENTS")]
+    with open("students.csv", encoding="utf-8") as f:
+        profiles += [row["Skills"] for row in csv.DictReader(f)]
+    pool = sorted({sk for j in jobs for sk in j["skills"]})
+    rng  = random.Random(42)
+    profiles += [", ".join(rng.sample(pool, rng.randint(3, 7))) for _ in range(synthetic)]
+    return [p.replace(",", " ").lower() for p in profiles]
+
+
+def ranks(scores: list[float]) -> list[float]:
+    """Average ranks (1 = best), ties sharing the mean rank."""
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    out = [0.0] * len(scores)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and scores[order[j + 1]] == scores[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            out[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return out
+
+
+def spearman(a: list[float], b: list[float]) -> float:
+    ra, rb = ranks(a), ranks(b)
+    ma, mb = statistics.fmean(ra), statistics.fmean(rb)
+    cov = sum((x - ma) * (y - mb) for x, y in zip(ra, rb))
+    va  = sum((x - ma) ** 2 for x in ra) ** 0.5
+    vb  = sum((y - mb) ** 2 for y in rb) ** 0.5
+    return cov / (va * vb) if va and vb else 0.0
+
+
+def top_k_overlap(a: list[float], b: list[float], k: int) -> float:
+    top = lambda s: set(sorted(range(len(s)), key=lambda i: -s[i])[:k])
+    return len(top(a) & top(b)) / k
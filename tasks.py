@@ -0,0 +1,152 @@
+"""
+tasks.py  —  In-process background task runner with progress reporting
+----------------------------------------------------------------------
+Long Placement Cell operations (bulk ML scoring, bulk Gemini prep) run on a
+shared thread pool instead of the Streamlit script thread, so the page stays
+responsive while they work. Views poll the runner by task id.
+
+    runner  = TaskRunner()
+    task_id = runner.submit("Bulk scoring", score_all, students, jobs, owner="placement")
+    task    = runner.get(task_id)      → Task (status, done/total, result, error)
+    runner.cancel(task_id)             → cooperative: stops at the next progress()
+
+A task function receives its Task as the first argument and calls
+task.progress(done, total) as it goes; that call raises TaskCancelled once
+cancellation has been requested.
+"""
+
+import itertools
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+_FINISHED = {DONE, FAILED, CANCELLED}
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task function when its cancellation was requested."""
+
+
+class Task:
+    """State of one submitted job, safe to read from any thread."""
+
+    def __init__(self, task_id: int, name: str, owner: str | None):
+        self.id       = task_id
+        self.name     = name
+        self.owner    = owner
+        self.status   = QUEUED
+        self.done     = 0
+        self.total    = 0
+        self.message  = ""
+        self.result: Any = None
+        self.error: str | None = None
+        self.created  = time.time()
+        self.finished: float | None = None
+        self._cancel  = threading.Event()
+
+    @property
+    def fraction(self) -> float:
+        """Progress in [0, 1]; finished tasks always report 1."""
+        if self.status in _FINISHED:
+            return 1.0
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in _FINISHED
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def progress(self, done: int, total: int | None = None, message: str = "") -> None:
+        """Report progress from inside the task; raises TaskCancelled if cancelled."""
+        if self._cancel.is_set():
+            raise TaskCancelled
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message:
+            self.message = message
+
+
+class TaskRunner:
+    """
+    Thread-pool backed registry of named background tasks.
+
+    Threads rather than processes so task functions can be closures over
+    app state and report progress without pickling; the work submitted
+    here is either I/O bound (Gemini) or short pure-Python loops.
+    Only the most recent `keep` finished tasks are retained; `on_prune` is
+    called with each task dropped, e.g. to delete files its result points to.
+    """
+
+    def __init__(self, max_workers: int = 4, keep: int = 50,
+                 on_prune: Callable[[Task], None] | None = None):
+        self._pool  = ThreadPoolExecutor(max_workers=max_workers,
+                                         thread_name_prefix="smartplace-task")
+        self._tasks: dict[int, Task] = {}
+        self._ids   = itertools.count(1)
+        self._lock  = threading.Lock()
+        self._keep  = keep
+        self._on_prune = on_prune
+
+    def submit(self, name: str, fn: Callable[..., Any], *args,
+               owner: str | None = None, **kwargs) -> int:
+        """Queue fn(task, *args, **kwargs) and return the new task id."""
+        with self._lock:
+            task = Task(next(self._ids), name, owner)
+            self._tasks[task.id] = task
+            self._prune()
+        self._pool.submit(self._run, task, fn, args, kwargs)
+        return task.id
+
+    def _run(self, task: Task, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        if task.cancel_requested:
+            task.status = CANCELLED
+        else:
+            task.status = RUNNING
+            try:
+                task.result = fn(task, *args, **kwargs)
+                task.status = DONE
+            except TaskCancelled:
+                task.status = CANCELLED
+            except Exception as e:
+                task.error  = f"{e}\n{traceback.format_exc()}"
+                task.status = FAILED
+        task.finished = time.time()
+
+    def _prune(self) -> None:
+        finished = [t for t in self._tasks.values() if t.is_finished]
+        for t in sorted(finished, key=lambda t: t.created)[:max(len(finished) - self._keep, 0)]:
+            del self._tasks[t.id]
+            if self._on_prune is not None:
+                self._on_prune(t)
+
+    def get(self, task_id: int) -> Task | None:
+        return self._tasks.get(task_id)
+
+    def result(self, task_id: int) -> Any:
+        """Result of a finished task; None while it is still queued or running."""
+        task = self._tasks.get(task_id)
+        return task.result if task is not None and task.status == DONE else None
+
+    def cancel(self, task_id: int) -> bool:
+        """Request cancellation; False if the task is unknown or already finished."""
+        task = self._tasks.get(task_id)
+        if task is None or task.is_finished:
+            return False
+        task._cancel.set()
+        return True
+
+    def tasks(self, owner: str | None = None) -> list[Task]:
+        """Tasks newest first, optionally only those submitted by `owner`."""
+        with self._lock:
+            found = [t for t in self._tasks.values() if owner is None or t.owner == owner]
+        return sorted(found, key=lambda t: t.created, reverse=True)
+
+    def has_active(self, owner: str | None = None) -> bool:
+        return any(not t.is_finished for t in self.tasks(owner))
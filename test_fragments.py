@@ -0,0 +1,132 @@
+"""
+test_fragments.py  —  Which app sections each interaction re-executes
+---------------------------------------------------------------------
+A widget created inside an @st.fragment function reruns only that fragment,
+unless its handler calls a full st.rerun(). AppTest re-executes the whole
+script on every interaction, so it cannot observe this; these tests read
+app.py's structure instead and fail when an interaction would leave its
+fragment — e.g. Apply back on a full rerun, or the job picker moved out of
+the scoring table.
+
+    python -m pytest -q test_fragments.py
+"""
+
+import ast
+import os
+
+APP_PATH   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+FULL_RERUN = "script"          # every section runs
+
+
+def _is_st(node, attr: str) -> bool:
+    return (isinstance(node, ast.Attribute) and node.attr == attr
+            and isinstance(node.value, ast.Name) and node.value.id == "st")
+
+
+def _is_full_rerun(node) -> bool:
+    return (isinstance(node, ast.Call) and _is_st(node.func, "rerun")
+            and not any(k.arg == "scope" and isinstance(k.value, ast.Constant)
+                        and k.value.value == "fragment" for k in node.keywords))
+
+
+def _kwarg(call: ast.Call, name: str):
+    return next((k.value.value for k in call.keywords
+                 if k.arg == name and isinstance(k.value, ast.Constant)), None)
+
+
+class AppStructure:
+    """Fragments of app.py and the sections an interaction with a widget reruns."""
+
+    def __init__(self, source: str):
+        tree = ast.parse(source)
+        self.calls   = [n for n in ast.walk(tree) if isinstance(n, ast.Call)]
+        self.parents = {c: n for n in ast.walk(tree) for c in ast.iter_child_nodes(n)}
+        # @st.fragment / @st.fragment(...) decorators, or st.fragment(fn, ...) wrappers
+        wrapped = {c.args[0].id for c in self.calls if _is_st(c.func, "fragment")
+                   and c.args and isinstance(c.args[0], ast.Name)}
+        self.fragments = {
+            fn for fn in ast.walk(tree) if isinstance(fn, ast.FunctionDef)
+            and (fn.name in wrapped or any(_is_st(d.func if isinstance(d, ast.Call) else d, "fragment")
+                                           for d in fn.decorator_list))}
+
+    def section(self, fn: ast.FunctionDef) -> str:
+        """Name the fragment tallies itself under (count_section), else its function name."""
+        for c in ast.walk(fn):
+            if isinstance(c, ast.Call) and isinstance(c.func, ast.Name) and c.func.id == "count_section":
+                return c.args[0].value
+        return fn.name
+
+    def widget(self, match) -> ast.Call:
+        found = [c for c in self.calls if match(c)]
+        assert len(found) == 1, f"expected one matching widget call, found {len(found)}"
+        return found[0]
+
+    def sections_rerun_by(self, call: ast.Call) -> set[str]:
+        node = call
+        while node in self.parents and node not in self.fragments:
+            node = self.parents[node]
+        if node not in self.fragments:
+            return {FULL_RERUN}
+        # Handler: any `if` testing the name the widget's value is bound to
+        parent = self.parents[call]
+        if isinstance(parent, ast.Assign) and isinstance(parent.targets[0], ast.Name):
+            bound = parent.targets[0].id
+            for stmt in ast.walk(node):
+                if (isinstance(stmt, ast.If)
+                        and any(isinstance(n, ast.Name) and n.id == bound for n in ast.walk(stmt.test))
+                        and any(_is_full_rerun(n) for b in stmt.body for n in ast.walk(b))):
+                    return {FULL_RERUN}
+        return {self.section(node)}
+
+
+def app_source() -> str:
+    with open(APP_PATH, encoding="utf-8-sig") as f:
+        return f.read()
+
+
+def load_app(source: str | None = None) -> AppStructure:
+    return AppStructure(app_source() if source is None else source)
+
+
+def apply_button(c: ast.Call) -> bool:
+    return isinstance(c.func, ast.Name) and c.func.id == "render_job_card"
+
+
+def job_picker(c: ast.Call) -> bool:
+    return _is_st(c.func, "selectbox") and _kwarg(c, "key") == "dashboard_job"
+
+
+def skills_input(c: ast.Call) -> bool:
+    return (_is_st(c.func, "text_input") and c.args and isinstance(c.args[0], ast.Constant)
+            and c.args[0].value.startswith("⚡ Your Skills"))
+
+
+def recruiter_query(c: ast.Call) -> bool:
+    return _is_st(c.func, "text_input") and _kwarg(c, "key") == "recruiter_query"
+
+
+def test_apply_reruns_only_job_board():
+    app = load_app()
+    sections = app.sections_rerun_by(app.widget(apply_button))
+    assert sections == {"job_board"}
+    assert not sections & {"scoring_table", "profile_form"}
+
+
+def test_job_picker_reruns_only_scoring_table():
+    app = load_app()
+    sections = app.sections_rerun_by(app.widget(job_picker))
+    assert sections == {"scoring_table"}
+    assert "job_board" not in sections
+
+
+def test_typing_stays_in_its_fragment():
+    app = load_app()
+    assert app.sections_rerun_by(app.widget(skills_input)) == {"job_board"}
+    assert app.sections_rerun_by(app.widget(recruiter_query)) == {"recruiter_search"}
+
+
+def test_full_rerun_in_handler_is_detected():
+    source = app_source()
+    assert 'st.rerun(scope="fragment")' in source
+    app = load_app(source.replace('st.rerun(scope="fragment")', "st.rerun()"))
+    assert app.sections_rerun_by(app.widget(apply_button)) == {FULL_RERUN}